@@ -6,11 +6,25 @@ It reads data from files, applies YAML-defined rules, and reports violations.
 
 __version__ = "0.1.0-alpha"
 
-from .config import ConfigLoader, ComplianceConfig
-from .connectors import ConnectorFactory
 from .exceptions import *
 from .utils import *
 
+# Config and connectors drag in pydantic, pandas and database drivers, so they
+# are resolved on first attribute access instead of at import time (PEP 562).
+_LAZY_EXPORTS = {
+    'ConfigLoader': '.config',
+    'ComplianceConfig': '.config',
+    'ConnectorFactory': '.connectors',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'ConfigLoader',
     'ComplianceConfig',
@@ -1,50 +1,78 @@
 #!/usr/bin/env python3
 """Command-line interface for Compliance Copilot."""
 
+import io
 import sys
 import argparse
 import shutil
+import signal
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
 from .version import get_version
-from .config import ConfigLoader
-from .engine import RuleEngine, RuleStatus
 from .exceptions import ComplianceCopilotError
-from .utils import ensure_directory, list_files
 from .observability import StructuredLogger, MetricsCollector, Tracer, ErrorTracker, ErrorCategory
-from .output.html_reporter import HtmlReporter
-from .scheduler import ScanScheduler
+from .observability.errors import enable_console_errors
+
+# Engine, config, scheduler and reporters pull in pandas/pydantic/yaml, so
+# they are imported inside the command handlers that need them.
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
-# Global observability instances
-logger = None
-metrics = None
-tracer = None
-error_tracker = None
 _scheduler = None
+_scheduler_lock = threading.Lock()
+_shutdown = threading.Event()
+
+_SEP = "=" * 60
+
+# Keyed by RuleStatus value so the engine needn't be imported at module load
+_STATUS_ICONS = {"PASS": "✅", "FAIL": "❌", "ERROR": "⚠️"}
+
+# Above this many results the JSON report is streamed record by record
+JSON_STREAM_THRESHOLD = 10_000
+
+# Report files are written through a 512 KiB buffer to cut write() syscalls
+REPORT_BUFFER_SIZE = 1 << 19
+
+
+# Observability objects create directories and files, so each one is built on
+# first use by the commands that need it rather than up front in main().
+@lru_cache(maxsize=None)
+def get_logger(level: str = "INFO") -> StructuredLogger:
+    return StructuredLogger("compliance_copilot", level=level)
+
+
+@lru_cache(maxsize=None)
+def get_metrics() -> MetricsCollector:
+    return MetricsCollector()
+
+
+@lru_cache(maxsize=None)
+def get_tracer() -> Tracer:
+    return Tracer()
+
+
+@lru_cache(maxsize=None)
+def get_error_tracker() -> ErrorTracker:
+    enable_console_errors()
+    return ErrorTracker()
 
 
 def main():
     """Main CLI entry point."""
-    global logger, metrics, tracer, error_tracker
-    
     parser = create_parser()
     args = parser.parse_args()
     
-    # Initialize observability with safe debug flag
-    debug = getattr(args, 'debug', False)
-    
-    logger = StructuredLogger(
-        "compliance_copilot",
-        level="DEBUG" if debug else "INFO"
-    )
-    metrics = MetricsCollector()
-    tracer = Tracer()
-    error_tracker = ErrorTracker()
-    
     if args.command == "run":
-        with tracer.trace("compliance_scan", attributes={"rules": args.rules, "data": args.data}):
+        with get_tracer().trace("compliance_scan", attributes={"rules": args.rules, "data": args.data}):
             run_command(args)
     elif args.command == "init":
         init_command(args)
@@ -76,6 +104,7 @@ def create_parser() -> argparse.ArgumentParser:
 Examples:
   compliance-copilot run rules/ data/
   compliance-copilot run rules.yaml data.csv --format json
+  compliance-copilot run rules/ data/ --workers 4
   compliance-copilot init --template soc2
   compliance-copilot schedule daily rules/ data/ --hour 9
   compliance-copilot schedule list
@@ -118,6 +147,17 @@ Examples:
         action="store_true",
         help="Enable debug output"
     )
+    run_parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Worker processes for rule evaluation (default: 1, in this process)"
+    )
+    run_parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Evaluate rules one at a time in this process (useful for debugging)"
+    )
     
     # Init command
     init_parser = subparsers.add_parser("init", help="Initialize a new project with a template")
@@ -160,6 +200,9 @@ Examples:
     # Schedule stop
     schedule_subparsers.add_parser("stop", help="Stop scheduler")
     
+    # Version command
+    subparsers.add_parser("version", help="Show version")
+    
     # Metrics command
     metrics_parser = subparsers.add_parser("metrics", help="Show metrics")
     metrics_parser.add_argument(
@@ -185,20 +228,53 @@ Examples:
     return parser
 
 
+@contextmanager
+def _buffered_stdout(enabled: bool = True):
+    """Coalesce console output into large writes for the duration of the block."""
+    original = sys.stdout
+    if not enabled or not hasattr(original, "buffer"):
+        yield
+        return
+    
+    original.flush()
+    sys.stdout = io.TextIOWrapper(
+        original.buffer,
+        encoding=original.encoding,
+        errors=original.errors,
+        line_buffering=False,
+        write_through=False
+    )
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        # Detach so the wrapper doesn't close the real stdout when collected
+        sys.stdout.detach()
+        sys.stdout = original
+
+
+def _templates_root():
+    """Return the directory holding the bundled project templates."""
+    try:
+        from importlib.resources import files
+    except ImportError:  # Python 3.8
+        return Path(__file__).parent / "templates"
+    return files("compliance_copilot.templates")
+
+
 def init_command(args):
     """Initialize a new project with a template."""
-    template_dir = Path(__file__).parent.parent.parent / 'examples' / 'templates' / args.template
-    if not template_dir.exists():
-        print(f"❌ Template '{args.template}' not found.")
-        sys.exit(1)
-    
-    output_dir = Path(args.output)
-    target = output_dir / args.template
+    template_dir = _templates_root() / args.template
+    target = Path(args.output) / args.template
     if target.exists():
         print(f"❌ Directory {target} already exists.")
         sys.exit(1)
     
-    shutil.copytree(template_dir, target)
+    try:
+        shutil.copytree(str(template_dir), target)
+    except FileNotFoundError:
+        print(f"❌ Template '{args.template}' not found.")
+        sys.exit(1)
     print(f"✅ Template '{args.template}' copied to {target}")
     print(f"\nNext steps:")
     print(f"  1. cd {target}")
@@ -208,6 +284,15 @@ def init_command(args):
 
 def run_command(args):
     """Execute the run command."""
+    from .config import ConfigLoader
+    from .engine import RuleEngine, RuleStatus
+    from .utils import ensure_directory
+    
+    logger = get_logger("DEBUG" if args.debug else "INFO")
+    metrics = get_metrics()
+    tracer = get_tracer()
+    error_tracker = get_error_tracker()
+    
     try:
         logger.info("scan_started", rules=args.rules, data=args.data, debug=args.debug)
         metrics.increment("scans_run")
@@ -233,7 +318,8 @@ def run_command(args):
             
             # Initialize rule engine
             with tracer.span("init_engine"):
-                engine = RuleEngine(config.dict(), debug=args.debug)
+                workers = 1 if args.serial else args.workers
+                engine = RuleEngine(config.model_dump(), debug=args.debug, workers=workers)
                 logger.info("engine_initialized")
             
             # Run the checks
@@ -245,82 +331,105 @@ def run_command(args):
             logger.info("rules_executed", count=len(results))
             
             # Print results to console
-            print(f"\n{'='*60}")
+            print(f"\n{_SEP}")
             print(f"COMPLIANCE SCAN RESULTS")
-            print(f"{'='*60}")
+            print(_SEP)
             print()
             
-            # Summary stats
-            total = len(results)
-            passed = sum(1 for r in results if r.status == RuleStatus.PASS)
-            failed = sum(1 for r in results if r.status == RuleStatus.FAIL)
-            errors = sum(1 for r in results if r.status == RuleStatus.ERROR)
-            
-            metrics.gauge("rules_passed", passed)
-            metrics.gauge("rules_failed", failed)
-            metrics.gauge("rules_errors", errors)
-            
-            # Print each rule result
-            for result in results:
-                if result.status == RuleStatus.PASS:
-                    status_icon = "✅"
-                    metrics.increment("rule_passed", tags={"rule": result.rule_id})
-                elif result.status == RuleStatus.FAIL:
-                    status_icon = "❌"
-                    metrics.increment("rule_failed", tags={"rule": result.rule_id})
-                    metrics.increment("violations", result.failed_rows)
-                else:
-                    status_icon = "⚠️"
-                    metrics.increment("rule_error", tags={"rule": result.rule_id})
+            # Console output is coalesced into large writes; --debug keeps it unbuffered
+            with _buffered_stdout(enabled=not args.debug):
+                # Print each rule result, tallying counts and metrics in the same pass
+                passed = failed = errors = 0
+                total_violations = 0
+                with_violations = []
+                batch = []
+                write = sys.stdout.write
                 
-                print(f"{status_icon} {result.rule_id}: {result.rule_name}")
-                
-                if result.status == RuleStatus.ERROR:
-                    print(f"   Error: {result.error_message}")
-                    error_tracker.track(
-                        Exception(result.error_message),
-                        category=ErrorCategory.RULE_EXECUTION,
-                        context={"rule_id": result.rule_id}
-                    )
-                else:
-                    print(f"   Pass rate: {result.pass_rate:.1f}% ({result.passed_rows}/{result.total_rows})")
+                for result in results:
+                    status_icon = _STATUS_ICONS.get(result.status.value, "⚠️")
+                    if result.status == RuleStatus.PASS:
+                        passed += 1
+                        batch.append(("rule_passed", {"rule": result.rule_id}, 1))
+                    elif result.status == RuleStatus.FAIL:
+                        failed += 1
+                        total_violations += result.failed_rows
+                        batch.append(("rule_failed", {"rule": result.rule_id}, 1))
+                    else:
+                        errors += 1
+                        batch.append(("rule_error", {"rule": result.rule_id}, 1))
+                    
+                    if result.violations:
+                        with_violations.append(result)
+                    
+                    out = [f"{status_icon} {result.rule_id}: {result.rule_name}\n"]
                     
-                    if result.violations and args.debug:
-                        print(f"   Violations: {result.failed_rows}")
-                        for i, v in enumerate(result.violations[:3]):
-                            print(f"     - Row {v['row_index']}")
-                        if len(result.violations) > 3:
-                            print(f"     ... and {len(result.violations) - 3} more")
+                    if result.status == RuleStatus.ERROR:
+                        out.append(f"   Error: {result.error_message}\n")
+                        # Emit what we have so the tracker's own message follows it
+                        write("".join(out))
+                        out = []
+                        error_tracker.track(
+                            Exception(result.error_message),
+                            category=ErrorCategory.RULE_EXECUTION,
+                            context={"rule_id": result.rule_id}
+                        )
+                    else:
+                        out.append(f"   Pass rate: {result.pass_rate:.1f}% ({result.passed_rows}/{result.total_rows})\n")
+                        
+                        if result.violations and args.debug:
+                            out.append(f"   Violations: {result.failed_rows}\n")
+                            for v in result.violations[:3]:
+                                out.append(f"     - Row {v['row_index']}\n")
+                            if result.failed_rows > 3:
+                                out.append(f"     ... and {result.failed_rows - 3} more\n")
+                    
+                    out.append("\n")
+                    write("".join(out))
                 
-                print()
-            
-            # Print summary
-            print(f"{'='*60}")
-            print(f"SUMMARY")
-            print(f"{'='*60}")
-            print(f"Total rules: {total}")
-            print(f"✅ Passed:    {passed}")
-            print(f"❌ Failed:    {failed}")
-            print(f"⚠️ Errors:    {errors}")
-            print()
+                total = len(results)
+                summary = {
+                    "total": total,
+                    "passed": passed,
+                    "failed": failed,
+                    "errors": errors
+                }
+                metrics.bulk_increment(batch)
+                if total_violations:
+                    metrics.increment("violations", total_violations)
+                metrics.gauge("rules_passed", passed)
+                metrics.gauge("rules_failed", failed)
+                metrics.gauge("rules_errors", errors)
+                
+                # Print summary
+                print(
+                    f"{_SEP}\n"
+                    f"SUMMARY\n"
+                    f"{_SEP}\n"
+                    f"Total rules: {total}\n"
+                    f"✅ Passed:    {passed}\n"
+                    f"❌ Failed:    {failed}\n"
+                    f"⚠️ Errors:    {errors}\n"
+                )
             
             # Save results based on format
             if args.format in ["json", "all"]:
                 with tracer.span("save_json"):
                     json_path = output_dir / "results.json"
-                    save_json_results(results, json_path)
+                    pretty = config.output.get("json", {}).get("pretty", True)
+                    save_json_results(results, json_path, summary, pretty=pretty)
                     print(f"📄 JSON results saved to: {json_path}")
                     metrics.increment("reports_generated", tags={"format": "json"})
             
             if args.format in ["csv", "all"]:
                 with tracer.span("save_csv"):
                     csv_path = output_dir / "violations.csv"
-                    save_csv_violations(results, csv_path)
+                    save_csv_violations(with_violations, csv_path)
                     print(f"📄 CSV violations saved to: {csv_path}")
                     metrics.increment("reports_generated", tags={"format": "csv"})
             
             if args.format in ["html", "all"]:
                 with tracer.span("save_html"):
+                    from .output.html_reporter import HtmlReporter
                     html_path = output_dir / "report.html"
                     reporter = HtmlReporter()
                     reporter.generate(results, html_path)
@@ -357,38 +466,35 @@ def run_command(args):
         sys.exit(1)
 
 
-def schedule_daily(args):
-    """Add a daily scheduled scan."""
+def _get_scheduler():
+    """Return the process-wide scheduler, creating it exactly once."""
     global _scheduler
     if _scheduler is None:
-        _scheduler = ScanScheduler()
-    
-    _scheduler.add_daily_scan(
+        with _scheduler_lock:
+            if _scheduler is None:
+                from .scheduler import ScanScheduler
+                _scheduler = ScanScheduler()
+    return _scheduler
+
+
+def schedule_daily(args):
+    """Add a daily scheduled scan."""
+    scheduler = _get_scheduler()
+    scheduler.add_daily_scan(
         rules_dir=args.rules,
         data_dir=args.data,
         output_dir=args.output,
         hour=args.hour,
         minute=args.minute
     )
-    _scheduler.start()
-    
-    # Keep running until interrupted
-    try:
-        import time
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        _scheduler.stop()
-        print("\n✅ Scheduler stopped")
+    scheduler.start()
+    _wait_for_shutdown()
 
 
 def schedule_weekly(args):
     """Add a weekly scheduled scan."""
-    global _scheduler
-    if _scheduler is None:
-        _scheduler = ScanScheduler()
-    
-    _scheduler.add_weekly_scan(
+    scheduler = _get_scheduler()
+    scheduler.add_weekly_scan(
         rules_dir=args.rules,
         data_dir=args.data,
         output_dir=args.output,
@@ -396,15 +502,19 @@ def schedule_weekly(args):
         hour=args.hour,
         minute=args.minute
     )
-    _scheduler.start()
+    scheduler.start()
+    _wait_for_shutdown()
+
+
+def _wait_for_shutdown():
+    """Block until Ctrl+C (or SIGTERM), then stop the scheduler."""
+    signal.signal(signal.SIGINT, lambda *_: _shutdown.set())
+    signal.signal(signal.SIGTERM, lambda *_: _shutdown.set())
     
-    try:
-        import time
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        _scheduler.stop()
-        print("\n✅ Scheduler stopped")
+    # Sleeps without periodic wake-ups until a handler sets the event
+    _shutdown.wait()
+    _scheduler.stop()
+    print("\n✅ Scheduler stopped")
 
 
 def schedule_list():
@@ -420,7 +530,7 @@ def schedule_list():
         return
     
     print("\n📅 SCHEDULED JOBS")
-    print("="*60)
+    print(_SEP)
     for job in jobs:
         print(f"Job ID: {job['id']}")
         print(f"  Next run: {job['next_run']}")
@@ -442,8 +552,10 @@ def schedule_stop():
 
 def show_metrics(args):
     """Show metrics command."""
+    metrics = get_metrics()
+    
     print("\n📊 COMPLIANCE COPILOT METRICS")
-    print("="*60)
+    print(_SEP)
     
     summary = metrics.summary()
     
@@ -480,13 +592,15 @@ def show_metrics(args):
 
 def show_errors(args):
     """Show errors command."""
+    error_tracker = get_error_tracker()
+    
     if args.clear:
         error_tracker.clear()
         print("✅ Error history cleared")
         return
     
     print("\n❌ RECENT ERRORS")
-    print("="*60)
+    print(_SEP)
     
     recent = error_tracker.get_recent(args.last)
     
@@ -512,68 +626,103 @@ def show_errors(args):
     print()
 
 
-def save_json_results(results, path):
-    """Save results as JSON."""
+def _dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize to JSON bytes, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if pretty else 0)
     import json
+    if pretty:
+        return json.dumps(obj, default=str, indent=2).encode("utf-8")
+    return json.dumps(obj, default=str, separators=(',', ':')).encode("utf-8")
+
+
+def _result_record(r) -> dict:
+    """JSON-ready view of a single rule result."""
+    return {
+        "rule_id": r.rule_id,
+        "rule_name": r.rule_name,
+        "status": r.status.value,
+        "pass_rate": r.pass_rate,
+        "total_rows": r.total_rows,
+        "passed_rows": r.passed_rows,
+        "failed_rows": r.failed_rows,
+        "execution_time_ms": r.execution_time_ms,
+        "error": r.error_message
+    }
+
+
+def summarize_results(results) -> dict:
+    """Tally rule results by status in a single pass."""
+    from .engine import RuleStatus
+    
+    counts = Counter(r.status for r in results)
+    return {
+        "total": len(results),
+        "passed": counts[RuleStatus.PASS],
+        "failed": counts[RuleStatus.FAIL],
+        "errors": counts[RuleStatus.ERROR]
+    }
+
+
+def save_json_results(results, path, summary: Optional[dict] = None, pretty: bool = True):
+    """Save results as JSON."""
     from datetime import datetime
     
-    data = {
-        "timestamp": datetime.utcnow().isoformat(),
-        "summary": {
-            "total": len(results),
-            "passed": sum(1 for r in results if r.status == RuleStatus.PASS),
-            "failed": sum(1 for r in results if r.status == RuleStatus.FAIL),
-            "errors": sum(1 for r in results if r.status == RuleStatus.ERROR)
-        },
-        "results": [
-            {
-                "rule_id": r.rule_id,
-                "rule_name": r.rule_name,
-                "status": r.status.value,
-                "pass_rate": r.pass_rate,
-                "total_rows": r.total_rows,
-                "passed_rows": r.passed_rows,
-                "failed_rows": r.failed_rows,
-                "execution_time_ms": r.execution_time_ms,
-                "error": r.error_message
-            }
-            for r in results
-        ]
-    }
+    if summary is None:
+        summary = summarize_results(results)
+    timestamp = datetime.utcnow().isoformat()
     
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(path, 'wb', buffering=REPORT_BUFFER_SIZE) as f:
+        if len(results) <= JSON_STREAM_THRESHOLD:
+            data = {
+                "timestamp": timestamp,
+                "summary": summary,
+                "results": [_result_record(r) for r in results]
+            }
+            f.write(_dumps(data, pretty=pretty))
+            return
+        
+        # Large scans: write one record at a time instead of building the whole document
+        f.write(b'{"timestamp":' + _dumps(timestamp) + b',"summary":' + _dumps(summary) + b',"results":[\n')
+        for i, r in enumerate(results):
+            if i:
+                f.write(b",\n")
+            f.write(_dumps(_result_record(r)))
+        f.write(b"\n]}\n")
 
 
 def save_csv_violations(results, path):
     """Save violations as CSV."""
     import csv
     
-    # Collect all violations
-    rows = []
+    # Gather column names without materializing the flattened rows
+    fieldnames = set()
     for result in results:
         for violation in result.violations:
-            rows.append({
-                "rule_id": result.rule_id,
-                "rule_name": result.rule_name,
-                "row_index": violation["row_index"],
-                **violation["row_data"]
-            })
-    
-    if not rows:
+            fieldnames.update(violation["row_data"].keys())
+    
+    if not any(result.violations for result in results):
         # Create empty file with headers
-        with open(path, 'w') as f:
+        with open(path, 'w', buffering=REPORT_BUFFER_SIZE) as f:
             f.write("rule_id,rule_name,row_index\n")
         return
     
-    # Get all column names
-    fieldnames = set()
-    for row in rows:
-        fieldnames.update(row.keys())
+    fieldnames.update(("rule_id", "rule_name", "row_index"))
+    
+    # Stream one row per violation straight into the writer
+    rows = (
+        {
+            "rule_id": result.rule_id,
+            "rule_name": result.rule_name,
+            "row_index": violation["row_index"],
+            **violation["row_data"]
+        }
+        for result in results
+        for violation in result.violations
+    )
     
-    # Write CSV
-    with open(path, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=sorted(fieldnames))
+    with open(path, 'w', buffering=REPORT_BUFFER_SIZE, newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=sorted(fieldnames), extrasaction='ignore')
         writer.writeheader()
         writer.writerows(rows)
 
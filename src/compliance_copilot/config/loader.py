@@ -1,15 +1,40 @@
 """Configuration loader that merges multiple sources."""
 
+import copy
 import os
-import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dotenv import load_dotenv
+from typing import Dict, Any, List, Optional, Tuple
 
 from .schema import ComplianceConfig
 from ..exceptions import ConfigFileNotFoundError, ConfigSyntaxError
 
 
+_TRUE_VALUES = frozenset({'true', 'yes', 'on', '1'})
+_FALSE_VALUES = frozenset({'false', 'no', 'off', '0'})
+
+# Parsed YAML keyed by (absolute path, mtime_ns, size); an edit changes the key
+_YAML_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+def _cached_yaml(path: Path) -> Dict[str, Any]:
+    """Parse a YAML file, reusing the previous parse if the file is unchanged."""
+    st = path.stat()
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    
+    if key not in _YAML_CACHE:
+        import yaml
+        # libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(path, 'r') as f:
+            try:
+                _YAML_CACHE[key] = yaml.load(f, Loader=loader) or {}
+            except yaml.YAMLError as e:
+                raise ConfigSyntaxError(str(path), 0, str(e))
+    
+    # Hand out a copy so merging never mutates the cached parse
+    return copy.deepcopy(_YAML_CACHE[key])
+
+
 class ConfigLoader:
     def __init__(self, config_dir: Optional[str] = None):
         self.config_dir = Path(config_dir) if config_dir else Path.cwd()
@@ -17,6 +42,7 @@ class ConfigLoader:
         
         env_file = self.config_dir / ".env"
         if env_file.exists():
+            from dotenv import load_dotenv
             load_dotenv(env_file)
     
     def load(self, config_file: str = "config.yaml") -> ComplianceConfig:
@@ -24,11 +50,11 @@ class ConfigLoader:
         
         user_config = self._load_user_config(config_file)
         if user_config:
-            config_dict = self._deep_merge(config_dict, user_config)
+            self._deep_merge(config_dict, user_config)
         
         env_config = self._load_from_env()
         if env_config:
-            config_dict = self._deep_merge(config_dict, env_config)
+            self._deep_merge(config_dict, env_config)
         
         return ComplianceConfig(**config_dict)
     
@@ -37,60 +63,77 @@ class ConfigLoader:
         if not defaults_path.exists():
             raise ConfigFileNotFoundError(str(defaults_path))
         
-        with open(defaults_path, 'r') as f:
-            try:
-                return yaml.safe_load(f) or {}
-            except yaml.YAMLError as e:
-                raise ConfigSyntaxError(str(defaults_path), 0, str(e))
+        return _cached_yaml(defaults_path)
     
     def _load_user_config(self, config_file: str) -> Optional[Dict[str, Any]]:
         config_path = self.config_dir / config_file
         if not config_path.exists():
             return None
         
-        with open(config_path, 'r') as f:
-            try:
-                return yaml.safe_load(f) or {}
-            except yaml.YAMLError as e:
-                raise ConfigSyntaxError(str(config_path), 0, str(e))
+        return _cached_yaml(config_path)
     
     def _load_from_env(self) -> Dict[str, Any]:
         config = {}
         prefix = "COMPLIANCE_"
         
-        for key, value in os.environ.items():
-            if not key.startswith(prefix):
-                continue
+        items = sorted(
+            (key[len(prefix):].lower().split('__'), value)
+            for key, value in os.environ.items()
+            if key.startswith(prefix)
+        )
+        
+        # Sorted neighbours share parent paths, so keep the previous chain of
+        # nested dicts and only walk the part of the path that differs.
+        prev_parents: List[str] = []
+        chain = [config]
+        for path, value in items:
+            parents = path[:-1]
             
-            path = key[len(prefix):].lower().split('__')
-            typed_value = self._convert_type(value)
+            common = 0
+            limit = min(len(parents), len(prev_parents))
+            while common < limit and parents[common] == prev_parents[common]:
+                common += 1
+            del chain[common + 1:]
             
-            current = config
-            for part in path[:-1]:
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
-            current[path[-1]] = typed_value
+            current = chain[-1]
+            for part in parents[common:]:
+                current = current.setdefault(part, {})
+                chain.append(current)
+            
+            current[path[-1]] = self._convert_type(value)
+            prev_parents = parents
         
         return config
     
     def _convert_type(self, value: str) -> Any:
-        if value.lower() in ('true', 'yes', 'on', '1'):
+        lowered = value.lower()
+        if lowered in _TRUE_VALUES:
             return True
-        if value.lower() in ('false', 'no', 'off', '0'):
+        if lowered in _FALSE_VALUES:
             return False
-        try:
-            if '.' in value:
-                return float(value)
-            return int(value)
-        except ValueError:
-            return value
+        
+        # Only values that could be numbers pay for the int/float attempt
+        first = value[:1]
+        if first and (first.isdigit() or first in '+-.'):
+            try:
+                if '.' in value:
+                    return float(value)
+                return int(value)
+            except ValueError:
+                pass
+        return value
     
     def _deep_merge(self, base: Dict, override: Dict) -> Dict:
-        result = base.copy()
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
-        return result
+        """Merge override into base in place and return base.
+        
+        Callers must own base; load() only passes freshly built dicts.
+        """
+        stack = [(base, override)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                if isinstance(value, dict) and isinstance(dst.get(key), dict):
+                    stack.append((dst[key], value))
+                else:
+                    dst[key] = value
+        return base
@@ -2,7 +2,7 @@
 
 from enum import Enum
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class LogLevel(str, Enum):
@@ -16,8 +16,13 @@ class CSVConnectorConfig(BaseModel):
     delimiter: str = "auto"
     encoding: str = "utf-8"
     header_row: int = Field(0, ge=0)
+    engine: Optional[str] = None  # "c" (default), "python" or "pyarrow"
+    chunksize: Optional[int] = Field(None, ge=1)
+    dtypes: Optional[Dict[str, str]] = None
+    parse_dates: Optional[List[str]] = None
     
-    @validator('delimiter')
+    @field_validator('delimiter')
+    @classmethod
     def validate_delimiter(cls, v):
         if v != "auto" and len(v) != 1:
             raise ValueError(f"Delimiter must be single character or 'auto'")
@@ -37,6 +42,16 @@ class EngineConfig(BaseModel):
     debug: bool = False
     max_violations_per_rule: int = Field(1000, ge=1)
     timeout_seconds: int = Field(30, ge=1)
+    expression_engine: Optional[str] = None
+    io_workers: int = Field(8, ge=1)
+    data_cache_mb: float = Field(0, ge=0)
+    
+    @field_validator('expression_engine')
+    @classmethod
+    def validate_expression_engine(cls, v):
+        if v is not None and v not in ("numexpr", "numba", "python"):
+            raise ValueError("expression_engine must be 'numexpr', 'numba', 'python' or unset")
+        return v
 
 
 class ConsoleOutputConfig(BaseModel):
@@ -66,21 +81,21 @@ class CacheConfig(BaseModel):
 
 class ComplianceConfig(BaseModel):
     engine: EngineConfig = Field(default_factory=EngineConfig)
-    connectors: Dict[str, Any] = {
-        "csv": CSVConnectorConfig().dict(),
-        "excel": ExcelConnectorConfig().dict(),
-        "pdf": PDFConnectorConfig().dict()
-    }
-    output: Dict[str, Any] = {
-        "console": ConsoleOutputConfig().dict(),
-        "json": JSONOutputConfig().dict(),
-        "csv": CSVOutputConfig().dict()
-    }
+    # Factories run per instance, so no validation happens at import time
+    connectors: Dict[str, Any] = Field(default_factory=lambda: {
+        "csv": CSVConnectorConfig().model_dump(),
+        "excel": ExcelConnectorConfig().model_dump(),
+        "pdf": PDFConnectorConfig().model_dump()
+    })
+    output: Dict[str, Any] = Field(default_factory=lambda: {
+        "console": ConsoleOutputConfig().model_dump(),
+        "json": JSONOutputConfig().model_dump(),
+        "csv": CSVOutputConfig().model_dump()
+    })
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     cache: CacheConfig = Field(default_factory=CacheConfig)
-    rules_directories: List[str] = ["rules"]
-    data_directories: List[str] = ["data"]
+    rules_directories: List[str] = Field(default_factory=lambda: ["rules"])
+    data_directories: List[str] = Field(default_factory=lambda: ["data"])
     output_directory: str = "output"
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
@@ -1,17 +1,6 @@
 """Data connectors for reading various data sources."""
 
 from .base import BaseConnector
-from .csv_connector import CSVConnector
-from .excel_connector import ExcelConnector
-from .pdf_connector import PDFConnector
-from .json_connector import JSONConnector
-from .parquet_connector import ParquetConnector
-from .sql_connector import SQLConnector
-from .mongodb_connector import MongoDBConnector
-from .postgresql_connector import PostgreSQLConnector
-from .sqlite_connector import SQLiteConnector
-from .bigquery_connector import BigQueryConnector
-from .factory import ConnectorFactory
 from .exceptions import (
     ConnectorError,
     FileNotFoundError,
@@ -20,6 +9,31 @@ from .exceptions import (
     EmptyFileError
 )
 
+# Concrete connectors pull in their drivers (pymongo, google-cloud-bigquery,
+# sqlalchemy, ...) so they are imported only when first accessed.
+_LAZY_EXPORTS = {
+    'CSVConnector': '.csv_connector',
+    'ExcelConnector': '.excel_connector',
+    'PDFConnector': '.pdf_connector',
+    'JSONConnector': '.json_connector',
+    'ParquetConnector': '.parquet_connector',
+    'SQLConnector': '.sql_connector',
+    'MongoDBConnector': '.mongodb_connector',
+    'PostgreSQLConnector': '.postgresql_connector',
+    'SQLiteConnector': '.sqlite_connector',
+    'BigQueryConnector': '.bigquery_connector',
+    'ConnectorFactory': '.factory',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     'BaseConnector',
     'CSVConnector',
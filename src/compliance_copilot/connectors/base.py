@@ -11,17 +11,31 @@ If we have a base class, we can guarantee that every connector has:
 This is called "polymorphism" - same interface, different implementations.
 """
 
-from abc import ABC, abstractmethod  # ABC = Abstract Base Class
-from pathlib import Path
+import logging
+import os
 from typing import Optional, Dict, Any
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timezone
 
-# We'll import our exceptions later when we create them
-# from ..exceptions import FileNotFoundError, DataLoadError
+# Aliased so the builtin FileNotFoundError raised by os.stat stays visible
+from .exceptions import FileNotFoundError as SourceNotFoundError, EmptyFileError
 
 
-class BaseConnector(ABC):
+logger = logging.getLogger(__name__)
+
+# Methods every connector must override. We track them by hand instead of
+# inheriting from abc.ABC so isinstance()/issubclass() checks stay on the
+# fast builtin path (no ABCMeta registry lookups).
+_ABSTRACT_METHODS = ("load", "validate")
+
+# categorize: object columns with fewer distinct values than this share of
+# their length become category dtype
+CATEGORY_MAX_RATIO = 0.5
+# Rows inspected first to rule out high-cardinality columns cheaply
+CATEGORY_SAMPLE_ROWS = 1000
+
+
+class BaseConnector:
     """ABSTRACT base class for all data connectors.
     
     "Abstract" means you CANNOT use this class directly.
@@ -29,7 +43,9 @@ class BaseConnector(ABC):
     the abstract methods.
     
     Think of this as a CONTRACT: any class that inherits from BaseConnector
-    MUST implement load() and validate().
+    MUST implement load() and validate(). Python refuses to instantiate a
+    class whose __abstractmethods__ is non-empty, which __init_subclass__
+    below keeps up to date.
     
     Example of what you CANNOT do:
         >>> connector = BaseConnector()  # ERROR! Abstract class
@@ -45,6 +61,10 @@ class BaseConnector(ABC):
         >>> connector = CSVConnector()  # OK! Child class
     """
     
+    # Database/API connectors set this to False: their "source" is a name,
+    # not a path, so there is no file to stat
+    is_file_based = True
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize connector with optional configuration.
         
@@ -68,9 +88,25 @@ class BaseConnector(ABC):
         # Use get_metadata() instead
         self._metadata = {}
         
-        print(f"✅ Initialized {self.__class__.__name__}")  # Debug output
+        # Opt-in: Arrow-backed columns keep strings in contiguous buffers
+        # instead of one Python object per cell
+        self.use_arrow = self.config.get("arrow_backend", False)
+        
+        # Opt-in: store repetitive string columns as category codes. Equality
+        # and isin checks get faster, but ordering comparisons (<, >) on those
+        # columns no longer work in filters
+        self.categorize = self.config.get("categorize", False)
+        
+        logger.debug("Initialized %s", self.__class__.__name__)
+    
+    def __init_subclass__(cls, **kwargs):
+        """Record which required methods a subclass still leaves unimplemented."""
+        super().__init_subclass__(**kwargs)
+        cls.__abstractmethods__ = frozenset(
+            name for name in _ABSTRACT_METHODS
+            if getattr(cls, name) is getattr(BaseConnector, name)
+        )
     
-    @abstractmethod
     def load(self, source: str, **kwargs) -> pd.DataFrame:
         """LOAD data from source into pandas DataFrame.
         
@@ -96,9 +132,8 @@ class BaseConnector(ABC):
             0  alice@...         True   admin
             1    bob@...        False    user
         """
-        pass  # 'pass' means "do nothing" - child classes will implement
+        raise NotImplementedError  # child classes will implement
     
-    @abstractmethod
     def validate(self, source: str) -> bool:
         """CHECK if source exists and is readable.
         
@@ -116,7 +151,7 @@ class BaseConnector(ABC):
             ... else:
             ...     print("File missing or wrong type")
         """
-        pass
+        raise NotImplementedError
     
     def get_metadata(self) -> Dict[str, Any]:
         """GET information about the last loaded source.
@@ -140,6 +175,50 @@ class BaseConnector(ABC):
         """
         return self._metadata.copy()  # Return a COPY so users can't modify original
     
+    def _stat_source(self, source: str) -> os.stat_result:
+        """STAT a file source once, rejecting missing or empty files.
+        
+        The result is handed on to _update_metadata(size_bytes=...) so a
+        load costs a single stat call, which matters on network filesystems.
+        """
+        try:
+            st = os.stat(source)
+        except FileNotFoundError:
+            raise SourceNotFoundError(str(source))
+        if st.st_size == 0:
+            raise EmptyFileError(str(source))
+        return st
+    
+    def _dtype_backend_kwargs(self) -> Dict[str, Any]:
+        """Extra keyword arguments for pandas readers that accept dtype_backend."""
+        return {"dtype_backend": "pyarrow"} if self.use_arrow else {}
+    
+    def _apply_dtype_backend(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert a frame built by hand to Arrow dtypes when arrow_backend is on."""
+        return df.convert_dtypes(dtype_backend="pyarrow") if self.use_arrow else df
+    
+    def _categorize(self, df: pd.DataFrame):
+        """Convert low-cardinality string columns of df to category, in place.
+        
+        Columns with missing values are skipped: category would turn None
+        into NaN and change how conditions like ``x == None`` evaluate.
+        """
+        for column, dtype in df.dtypes.items():
+            if dtype != object and not isinstance(dtype, pd.StringDtype):
+                continue
+            values = df[column]
+            try:
+                if values.isna().any():
+                    continue
+                sample = values.iloc[:CATEGORY_SAMPLE_ROWS]
+                if sample.nunique() >= CATEGORY_MAX_RATIO * len(sample):
+                    continue
+                if values.nunique() < CATEGORY_MAX_RATIO * len(values):
+                    df[column] = values.astype("category")
+            except TypeError:
+                # Unhashable cells (lists/dicts from JSON)
+                continue
+    
     def _update_metadata(self, source: str, df: pd.DataFrame, **extra):
         """UPDATE metadata after successful load (PRIVATE method).
         
@@ -151,24 +230,27 @@ class BaseConnector(ABC):
             df: The DataFrame that was created
             **extra: Additional metadata (connector-specific)
         """
+        if self.categorize and not df.empty:
+            self._categorize(df)
+        
         # Start with basic metadata
         self._metadata = {
             "source": str(source),
-            "loaded_at": datetime.utcnow().isoformat() + "Z",  # 'Z' means UTC
+            "loaded_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),  # 'Z' means UTC
             "rows": len(df),
-            "columns": list(df.columns) if not df.empty else [],
+            "columns": df.columns.tolist() if not df.empty else [],
             "connector": self.__class__.__name__,
             **extra  # Add any extra fields
         }
         
-        # Try to get file size (might fail for non-files like APIs)
-        try:
-            path = Path(source)
-            if path.exists():
-                self._metadata["size_bytes"] = path.stat().st_size
-        except:
-            # If we can't get size, just skip it
-            pass
+        # Record the file size when the source is a path on disk.
+        # Only OSError is caught, so Ctrl-C / SystemExit still propagate.
+        if "size_bytes" not in extra and self.is_file_based and isinstance(source, (str, os.PathLike)):
+            try:
+                self._metadata["size_bytes"] = os.stat(source).st_size
+            except OSError:
+                # Not a local file (e.g. a database collection name)
+                pass
     
     def __str__(self) -> str:
         """STRING representation of this connector.
@@ -187,3 +269,6 @@ class BaseConnector(ABC):
         Called when you type the connector name in the Python REPL.
         """
         return f"<{self.__class__.__name__} at {hex(id(self))}>"
+
+
+BaseConnector.__abstractmethods__ = frozenset(_ABSTRACT_METHODS)
@@ -1,14 +1,41 @@
 """Google BigQuery connector for Compliance Copilot."""
 import pandas as pd
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from google.cloud import bigquery
 from google.oauth2 import service_account
 from .base import BaseConnector
 from .exceptions import DataLoadError
 
+try:
+    # Streams results as Arrow batches instead of paging JSON over REST
+    from google.cloud import bigquery_storage
+except ImportError:
+    bigquery_storage = None
+
+
+def _build_clients(project_id: str, credentials_path: Optional[str]) -> Tuple[bigquery.Client, Any]:
+    """Authenticate and create the BigQuery (and, if installed, Storage Read) clients."""
+    credentials = None
+    if credentials_path:
+        credentials = service_account.Credentials.from_service_account_file(
+            credentials_path
+        )
+    # credentials=None falls back to the default credentials
+    client = bigquery.Client(project=project_id, credentials=credentials)
+    bqstorage_client = None
+    if bigquery_storage is not None:
+        bqstorage_client = bigquery_storage.BigQueryReadClient(credentials=credentials)
+    return client, bqstorage_client
+
+
 class BigQueryConnector(BaseConnector):
     """Reads data from Google BigQuery."""
     
+    is_file_based = False
+    
+    # Authenticated clients shared by every connector for the same project
+    _client_cache: Dict[Tuple[str, Optional[str]], Tuple[bigquery.Client, Any]] = {}
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config or {})
         self.project_id = self.config.get('project_id')
@@ -20,32 +47,28 @@ class BigQueryConnector(BaseConnector):
         if not self.project_id:
             raise ValueError("BigQueryConnector requires 'project_id' in config")
         
-        # Initialize client
-        if self.credentials_path:
-            credentials = service_account.Credentials.from_service_account_file(
-                self.credentials_path
-            )
-            self.client = bigquery.Client(
-                project=self.project_id,
-                credentials=credentials
+        # Reuse the client (and its token) for this project if we have one
+        key = (self.project_id, self.credentials_path)
+        clients = self._client_cache.get(key)
+        if clients is None:
+            clients = self._client_cache.setdefault(
+                key, _build_clients(self.project_id, self.credentials_path)
             )
-        else:
-            # Use default credentials
-            self.client = bigquery.Client(project=self.project_id)
+        self.client, self.bqstorage_client = clients
     
     def load(self, source: str = None, **kwargs) -> pd.DataFrame:
         """Load data from BigQuery."""
         try:
             if self.query:
                 # Use custom query
-                df = self.client.query(self.query).to_dataframe()
+                df = self._query_to_dataframe(self.query)
             else:
                 # Use table reference
                 if not self.dataset_id or not self.table_id:
                     raise ValueError("Either 'query' or both 'dataset_id' and 'table_id' must be provided")
                 
                 table_ref = f"{self.project_id}.{self.dataset_id}.{self.table_id}"
-                df = self.client.query(f"SELECT * FROM `{table_ref}`").to_dataframe()
+                df = self._query_to_dataframe(f"SELECT * FROM `{table_ref}`")
             
             self._update_metadata(source or "bigquery", df)
             return df
@@ -53,14 +76,24 @@ class BigQueryConnector(BaseConnector):
         except Exception as e:
             raise DataLoadError("BigQuery", str(e))
     
+    def _query_to_dataframe(self, sql: str) -> pd.DataFrame:
+        """Run a query and convert its Arrow result without an extra copy."""
+        table = self.client.query(sql).to_arrow(
+            bqstorage_client=self.bqstorage_client,
+            create_bqstorage_client=False
+        )
+        return table.to_pandas(
+            self_destruct=True,
+            types_mapper=pd.ArrowDtype if self.use_arrow else None
+        )
+    
     def validate(self, source: str = None) -> bool:
-        """Check if BigQuery is accessible."""
-        try:
-            # Try to list datasets as a connection test
-            list(self.client.list_datasets(max_results=1))
-            return True
-        except:
-            return False
+        """Check that a BigQuery client is configured.
+        
+        No request is sent: connectivity and permissions are verified by the
+        first real query, which saves a round-trip per validation.
+        """
+        return self.client is not None
     
     def list_datasets(self) -> list:
         """List all datasets in the project."""
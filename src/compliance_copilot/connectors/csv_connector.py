@@ -1,42 +1,121 @@
 """CSV file connector."""
 
+import csv
+import os
 import pandas as pd
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, Union
 
 from .base import BaseConnector
-from .exceptions import FileNotFoundError, DataLoadError, EmptyFileError
+from .exceptions import DataLoadError, EmptyFileError
+
+# Enough of the file for Sniffer to see several complete rows
+SNIFF_BYTES = 64 * 1024
 
 
 class CSVConnector(BaseConnector):
+    _SUFFIXES = frozenset({'.csv', '.tsv', '.txt'})
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config or {})
         self.delimiter = self.config.get("delimiter", "auto")
         self.encoding = self.config.get("encoding", "utf-8")
         self.header_row = self.config.get("header_row", 0)
+        # "pyarrow" parses in parallel but infers dates, which changes how
+        # rule conditions compare those columns, so it is opt-in
+        self.engine = self.config.get("engine") or "c"
+        self.chunksize = self.config.get("chunksize")
+        # Known column types skip pandas' per-column inference pass
+        self.dtypes = self.config.get("dtypes")
+        self.parse_dates = self.config.get("parse_dates")
     
-    def load(self, source: str, **kwargs) -> pd.DataFrame:
-        path = Path(source)
+    def load(self, source: str, chunksize: Optional[int] = None,
+             **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """Read the file into a DataFrame.
         
-        if not path.exists():
-            raise FileNotFoundError(str(path))
+        With a chunksize (argument or config) an iterator of DataFrames is
+        returned instead, as the SQL connectors do.
+        """
+        chunksize = chunksize or self.chunksize
+        if chunksize:
+            return self.iter_chunks(source, chunksize)
         
-        if path.stat().st_size == 0:
-            raise EmptyFileError(str(path))
+        path = Path(source)
+        st = self._stat_source(source)
         
         try:
+            # The C parser can read straight from the page cache via mmap
             df = pd.read_csv(
                 path,
-                encoding=self.encoding,
-                header=self.header_row
+                engine=self.engine,
+                memory_map=self.engine == "c",
+                **self._read_options(path),
+                **self._dtype_backend_kwargs()
             )
-            self._update_metadata(source, df)
+            self._update_metadata(source, df, size_bytes=st.st_size)
             return df
         except pd.errors.EmptyDataError:
             raise EmptyFileError(str(path))
         except Exception as e:
             raise DataLoadError(str(path), str(e))
     
-    def validate(self, source: str) -> bool:
+    def iter_chunks(self, source: str, chunksize: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Yield the file as DataFrames of at most ``chunksize`` rows.
+        
+        Keeps peak memory bounded for files larger than RAM. pyarrow can't
+        read incrementally, so this always uses the C parser.
+        """
         path = Path(source)
-        return path.exists() and path.suffix.lower() in ['.csv', '.tsv', '.txt']
+        st = self._stat_source(source)
+        chunksize = chunksize or self.chunksize or 100_000
+        
+        rows = 0
+        columns = []
+        try:
+            with pd.read_csv(
+                path,
+                engine="c",
+                memory_map=True,
+                chunksize=chunksize,
+                **self._read_options(path),
+                **self._dtype_backend_kwargs()
+            ) as reader:
+                for chunk in reader:
+                    rows += len(chunk)
+                    columns = list(chunk.columns)
+                    yield chunk
+        except pd.errors.EmptyDataError:
+            raise EmptyFileError(str(path))
+        except Exception as e:
+            raise DataLoadError(str(path), str(e))
+        
+        self._update_metadata(source, pd.DataFrame(), rows=rows, columns=columns, size_bytes=st.st_size)
+    
+    def _read_options(self, path: Path) -> Dict[str, Any]:
+        """Keyword arguments shared by every read_csv call."""
+        return {
+            "sep": self._resolve_delimiter(path),
+            "encoding": self.encoding,
+            "header": self.header_row,
+            "dtype": self.dtypes,
+            "parse_dates": self.parse_dates,
+        }
+    
+    def _resolve_delimiter(self, path: Path) -> str:
+        """Return the configured delimiter, sniffing it from the file head for "auto"."""
+        if self.delimiter != "auto":
+            return self.delimiter
+        
+        fallback = "\t" if path.suffix.lower() == ".tsv" else ","
+        with open(path, "rb") as f:
+            sample = f.read(SNIFF_BYTES).decode(self.encoding, errors="ignore")
+        # Drop a trailing partial line so it can't skew the column count
+        if len(sample) >= SNIFF_BYTES and "\n" in sample:
+            sample = sample[:sample.rindex("\n")]
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=",\t;|").delimiter
+        except csv.Error:
+            return fallback
+    
+    def validate(self, source: str) -> bool:
+        return os.path.isfile(source) and os.path.splitext(source)[1].lower() in self._SUFFIXES
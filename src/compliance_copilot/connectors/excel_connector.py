@@ -1,5 +1,6 @@
 """Excel file connector."""
 
+import os
 import pandas as pd
 from pathlib import Path
 from typing import Optional, Dict, Any, Union
@@ -7,8 +8,13 @@ from typing import Optional, Dict, Any, Union
 from .base import BaseConnector
 from .exceptions import FileNotFoundError, DataLoadError
 
+# How pandas reports an unknown sheet name (older releases, then pandas 2+)
+_MISSING_SHEET = ("No sheet named", "Worksheet named")
+
 
 class ExcelConnector(BaseConnector):
+    _SUFFIXES = frozenset({'.xlsx', '.xls'})
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config or {})
         self.sheet_name = self.config.get("sheet_name", 0)
@@ -23,15 +29,11 @@ class ExcelConnector(BaseConnector):
         sheet = sheet_name if sheet_name is not None else self.sheet_name
         
         try:
-            df = pd.read_excel(
-                path,
-                sheet_name=sheet,
-                header=self.header_row
-            )
+            df = self._read_excel(path, sheet)
             self._update_metadata(source, df, sheet_name=str(sheet))
             return df
         except ValueError as e:
-            if "No sheet named" in str(e):
+            if any(marker in str(e) for marker in _MISSING_SHEET):
                 sheets = self.get_sheets(source)
                 raise DataLoadError(
                     str(path),
@@ -41,9 +43,24 @@ class ExcelConnector(BaseConnector):
         except Exception as e:
             raise DataLoadError(str(path), str(e))
     
+    def _read_excel(self, path: Path, sheet: Union[str, int]) -> pd.DataFrame:
+        """Read one sheet with pd.read_excel, accepting an index given as a string."""
+        try:
+            return pd.read_excel(
+                path,
+                sheet_name=sheet,
+                header=self.header_row,
+                **self._dtype_backend_kwargs()
+            )
+        except ValueError as e:
+            # The config schema stores a sheet index as a string, e.g. "0";
+            # a sheet actually named that still wins
+            if isinstance(sheet, str) and sheet.isdigit() and any(marker in str(e) for marker in _MISSING_SHEET):
+                return self._read_excel(path, int(sheet))
+            raise
+    
     def validate(self, source: str) -> bool:
-        path = Path(source)
-        return path.exists() and path.suffix.lower() in ['.xlsx', '.xls']
+        return os.path.isfile(source) and os.path.splitext(source)[1].lower() in self._SUFFIXES
     
     def get_sheets(self, source: str) -> list:
         path = Path(source)
@@ -1,58 +1,70 @@
 """Connector factory - creates the right connector for a data source."""
 
-from pathlib import Path
-from typing import Dict, Type, Optional
+import os
+from functools import lru_cache
+from importlib import import_module
+from types import MappingProxyType
+from typing import Dict, Mapping, Type, Optional, Tuple
 
 from .base import BaseConnector
-from .csv_connector import CSVConnector
-from .excel_connector import ExcelConnector
-from .pdf_connector import PDFConnector
-from .json_connector import JSONConnector
-from .parquet_connector import ParquetConnector
-from .sql_connector import SQLConnector
-from .mongodb_connector import MongoDBConnector
-from .postgresql_connector import PostgreSQLConnector
-from .sqlite_connector import SQLiteConnector
-from .bigquery_connector import BigQueryConnector
 from .exceptions import UnsupportedFormatError
 
+__all__ = ["ConnectorFactory"]
+
+
+@lru_cache(maxsize=None)
+def _load_connector(module: str, name: str) -> Type[BaseConnector]:
+    """Import a connector submodule on first use and return its class."""
+    return getattr(import_module(f".{module}", __package__), name)
+
 
 class ConnectorFactory:
-    _connectors: Dict[str, Type[BaseConnector]] = {
+    # Connectors are named as (submodule, class) so that their drivers are
+    # only imported when a source of that type is actually loaded.
+    # Read-only views: instances cache what they build from these tables
+    _connectors: Mapping[str, Tuple[str, str]] = MappingProxyType({
         # File-based connectors
-        '.csv': CSVConnector,
-        '.tsv': CSVConnector,
-        '.txt': CSVConnector,
-        '.xlsx': ExcelConnector,
-        '.xls': ExcelConnector,
-        '.pdf': PDFConnector,
-        '.json': JSONConnector,
-        '.parquet': ParquetConnector,
-        '.pq': ParquetConnector,
-        '.db': SQLiteConnector,
-        '.sqlite': SQLiteConnector,
-        '.sqlite3': SQLiteConnector,
-    }
+        '.csv': ('csv_connector', 'CSVConnector'),
+        '.tsv': ('csv_connector', 'CSVConnector'),
+        '.txt': ('csv_connector', 'CSVConnector'),
+        '.xlsx': ('excel_connector', 'ExcelConnector'),
+        '.xls': ('excel_connector', 'ExcelConnector'),
+        '.pdf': ('pdf_connector', 'PDFConnector'),
+        '.json': ('json_connector', 'JSONConnector'),
+        '.parquet': ('parquet_connector', 'ParquetConnector'),
+        '.pq': ('parquet_connector', 'ParquetConnector'),
+        '.db': ('sqlite_connector', 'SQLiteConnector'),
+        '.sqlite': ('sqlite_connector', 'SQLiteConnector'),
+        '.sqlite3': ('sqlite_connector', 'SQLiteConnector'),
+    })
     
     # Database connectors (no file extension)
-    _database_connectors = {
-        'mongodb': MongoDBConnector,
-        'postgresql': PostgreSQLConnector,
-        'bigquery': BigQueryConnector,
-    }
+    _database_connectors: Mapping[str, Tuple[str, str]] = MappingProxyType({
+        'mongodb': ('mongodb_connector', 'MongoDBConnector'),
+        'postgresql': ('postgresql_connector', 'PostgreSQLConnector'),
+        'bigquery': ('bigquery_connector', 'BigQueryConnector'),
+    })
     
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
+        # One connector per extension; the config for it never changes
+        self._instance_cache: Dict[str, BaseConnector] = {}
     
     def get_connector(self, source: str) -> BaseConnector:
         """Get connector for file-based source."""
-        ext = Path(source).suffix.lower()
+        # splitext is plain string slicing; Path() would parse the whole path
+        ext = os.path.splitext(source)[1].lower()
+        connector = self._instance_cache.get(ext)
+        if connector is not None:
+            return connector
+        
         if ext not in self._connectors:
             raise UnsupportedFormatError(ext, list(self._connectors.keys()))
         
-        connector_class = self._connectors[ext]
+        connector_class = _load_connector(*self._connectors[ext])
         connector_config = self.config.get(ext[1:], {})
-        return connector_class(connector_config)
+        connector = self._instance_cache[ext] = connector_class(connector_config)
+        return connector
     
     def get_database_connector(self, db_type: str) -> BaseConnector:
         """Get connector for database source."""
@@ -60,7 +72,7 @@ class ConnectorFactory:
             raise ValueError(f"Unsupported database type: {db_type}. "
                            f"Supported: {list(self._database_connectors.keys())}")
         
-        connector_class = self._database_connectors[db_type]
+        connector_class = _load_connector(*self._database_connectors[db_type])
         connector_config = self.config.get(db_type, {})
         return connector_class(connector_config)
     
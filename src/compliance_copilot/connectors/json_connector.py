@@ -1,11 +1,12 @@
 """JSON file connector."""
 
+import os
 import pandas as pd
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 from .base import BaseConnector
-from .exceptions import FileNotFoundError, DataLoadError, EmptyFileError
+from .exceptions import DataLoadError
 
 
 class JSONConnector(BaseConnector):
@@ -16,6 +17,8 @@ class JSONConnector(BaseConnector):
     - JSON lines format: one JSON object per line
     """
     
+    _SUFFIXES = frozenset({'.json'})
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config or {})
         self.encoding = self.config.get("encoding", "utf-8")
@@ -23,25 +26,21 @@ class JSONConnector(BaseConnector):
     
     def load(self, source: str, **kwargs) -> pd.DataFrame:
         path = Path(source)
-        
-        if not path.exists():
-            raise FileNotFoundError(str(path))
-        
-        if path.stat().st_size == 0:
-            raise EmptyFileError(str(path))
+        st = self._stat_source(source)
         
         try:
-            # pandas can read JSON directly
+            # pandas can read JSON directly; it also converts date columns
+            # (*_at, timestamp, date, ...) and infers dtypes
             df = pd.read_json(
                 path,
                 encoding=self.encoding,
-                lines=self.lines
+                lines=self.lines,
+                **self._dtype_backend_kwargs()
             )
-            self._update_metadata(source, df)
+            self._update_metadata(source, df, size_bytes=st.st_size)
             return df
         except Exception as e:
             raise DataLoadError(str(path), str(e))
     
     def validate(self, source: str) -> bool:
-        path = Path(source)
-        return path.exists() and path.suffix.lower() == '.json'
+        return os.path.isfile(source) and os.path.splitext(source)[1].lower() in self._SUFFIXES
@@ -5,9 +5,51 @@ from pymongo import MongoClient
 from .base import BaseConnector
 from .exceptions import DataLoadError
 
+# MongoClient keeps a thread-safe connection pool, so one per server is shared
+_clients: Dict[str, MongoClient] = {}
+
+
+def _get_client(connection_string: str) -> MongoClient:
+    """Return the shared client for a connection string, creating it once."""
+    client = _clients.get(connection_string)
+    if client is None:
+        client = _clients.setdefault(
+            connection_string,
+            MongoClient(connection_string, serverSelectionTimeoutMS=5000)
+        )
+    return client
+
+
+def _collect_columns(cursor) -> Dict[str, list]:
+    """Build column lists from a cursor in a single pass.
+    
+    Fields missing from a document are filled with None so every column
+    ends up the same length. ObjectIds are converted to strings on the way
+    through so the frame serializes to JSON.
+    """
+    columns: Dict[str, list] = {}
+    rows = 0
+    for doc in cursor:
+        for key, value in doc.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * rows
+            elif len(column) < rows:
+                column.extend([None] * (rows - len(column)))
+            column.append(str(value) if key == '_id' else value)
+        rows += 1
+    
+    for column in columns.values():
+        if len(column) < rows:
+            column.extend([None] * (rows - len(column)))
+    return columns
+
+
 class MongoDBConnector(BaseConnector):
     """Reads data from MongoDB collections."""
     
+    is_file_based = False
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config or {})
         self.connection_string = self.config.get('connection_string', 'mongodb://localhost:27017/')
@@ -15,6 +57,7 @@ class MongoDBConnector(BaseConnector):
         self.collection = self.config.get('collection')
         self.query = self.config.get('query', {})
         self.project = self.config.get('project', None)
+        self.batch_size = self.config.get('batch_size', 10000)
         
         if not self.database or not self.collection:
             raise ValueError("MongoDBConnector requires 'database' and 'collection' in config")
@@ -22,19 +65,14 @@ class MongoDBConnector(BaseConnector):
     def load(self, source: str = None, **kwargs) -> pd.DataFrame:
         """Load data from MongoDB collection."""
         try:
-            client = MongoClient(self.connection_string, serverSelectionTimeoutMS=5000)
+            client = _get_client(self.connection_string)
             db = client[self.database]
             coll = db[self.collection]
             
-            # Execute query with optional projection
-            cursor = coll.find(self.query, self.project)
-            df = pd.DataFrame(list(cursor))
-            
-            # Convert ObjectId to string for JSON serialization
-            if '_id' in df.columns:
-                df['_id'] = df['_id'].astype(str)
+            # Execute query with optional projection, fetching in large batches
+            cursor = coll.find(self.query, self.project).batch_size(self.batch_size)
+            df = self._apply_dtype_backend(pd.DataFrame(_collect_columns(cursor)))
             
-            client.close()
             self._update_metadata(source or f"{self.database}.{self.collection}", df)
             return df
             
@@ -44,9 +82,7 @@ class MongoDBConnector(BaseConnector):
     def validate(self, source: str = None) -> bool:
         """Check if MongoDB is accessible."""
         try:
-            client = MongoClient(self.connection_string, serverSelectionTimeoutMS=5000)
-            client.server_info()
-            client.close()
+            _get_client(self.connection_string).server_info()
             return True
         except:
             return False
@@ -54,7 +90,7 @@ class MongoDBConnector(BaseConnector):
     def get_collections(self) -> list:
         """List all collections in the database."""
         try:
-            client = MongoClient(self.connection_string)
+            client = _get_client(self.connection_string)
             db = client[self.database]
             return db.list_collection_names()
         except Exception as e:
@@ -1,11 +1,12 @@
 """Parquet file connector."""
 
+import os
 import pandas as pd
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 from .base import BaseConnector
-from .exceptions import FileNotFoundError, DataLoadError, EmptyFileError
+from .exceptions import DataLoadError
 
 
 class ParquetConnector(BaseConnector):
@@ -15,26 +16,42 @@ class ParquetConnector(BaseConnector):
     Requires pyarrow.
     """
     
+    _SUFFIXES = frozenset({'.parquet', '.pq'})
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config or {})
-        # No specific config needed for basic parquet reading
+        # Only these columns / row groups are decoded (None reads everything)
+        self.columns = self.config.get("columns")
+        self.filters = self.config.get("filters")
+        
+        try:
+            import pyarrow.parquet as pq
+            self.pq = pq
+        except ImportError:
+            raise ImportError("pyarrow is required for Parquet support. Install with: pip install pyarrow")
     
     def load(self, source: str, **kwargs) -> pd.DataFrame:
         path = Path(source)
-        
-        if not path.exists():
-            raise FileNotFoundError(str(path))
-        
-        if path.stat().st_size == 0:
-            raise EmptyFileError(str(path))
+        st = self._stat_source(source)
         
         try:
-            df = pd.read_parquet(path)
-            self._update_metadata(source, df)
+            table = self.pq.read_table(
+                path,
+                columns=self.columns,
+                filters=self.filters,
+                use_threads=True,
+                memory_map=True
+            )
+            # Release Arrow buffers column by column while converting
+            df = table.to_pandas(
+                self_destruct=True,
+                types_mapper=pd.ArrowDtype if self.use_arrow else None
+            )
+            del table
+            self._update_metadata(source, df, size_bytes=st.st_size)
             return df
         except Exception as e:
             raise DataLoadError(str(path), str(e))
     
     def validate(self, source: str) -> bool:
-        path = Path(source)
-        return path.exists() and path.suffix.lower() in ['.parquet', '.pq']
+        return os.path.isfile(source) and os.path.splitext(source)[1].lower() in self._SUFFIXES
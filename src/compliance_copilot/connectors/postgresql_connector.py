@@ -1,13 +1,14 @@
 """PostgreSQL connector for Compliance Copilot."""
 import pandas as pd
-from typing import Optional, Dict, Any
-from sqlalchemy import create_engine, text
+from typing import Optional, Dict, Any, Iterator, Union
 from .base import BaseConnector
 from .exceptions import DataLoadError
 
 class PostgreSQLConnector(BaseConnector):
     """Reads data from PostgreSQL databases."""
     
+    is_file_based = False
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config or {})
         self.host = self.config.get('host', 'localhost')
@@ -17,26 +18,70 @@ class PostgreSQLConnector(BaseConnector):
         self.password = self.config.get('password')
         self.table = self.config.get('table')
         self.query = self.config.get('query')
+        # Rows per DataFrame when streaming; None loads everything at once
+        self.chunksize = self.config.get('chunksize')
         
         if not self.database:
             raise ValueError("PostgreSQLConnector requires 'database' in config")
         
         # Build connection string
         self.connection_string = f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+        
+        # One pooled engine per connector, created on first use: connections
+        # are reused across load/validate/get_tables instead of re-handshaking
+        self._engine = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.dispose()
+    
+    def dispose(self):
+        """Close all pooled connections."""
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+    
+    def _get_engine(self):
+        if self._engine is None:
+            # SQLAlchemy is slow to import, so it is only loaded once a query runs
+            from sqlalchemy import create_engine
+            
+            self._engine = create_engine(
+                self.connection_string,
+                pool_size=self.config.get('pool_size', 5),
+                max_overflow=self.config.get('max_overflow', 10),
+                pool_pre_ping=True,
+                pool_recycle=1800
+            )
+        return self._engine
     
-    def load(self, source: str = None, **kwargs) -> pd.DataFrame:
-        """Load data from PostgreSQL table or query."""
+    def load(self, source: str = None, chunksize: Optional[int] = None,
+             **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """Load data from PostgreSQL table or query.
+        
+        With a chunksize (argument or config) rows are streamed through a
+        server-side cursor and an iterator of DataFrames is returned.
+        """
+        chunksize = chunksize or self.chunksize
+        if chunksize:
+            if not self.query and not self.table:
+                raise DataLoadError(self.database, "Either 'table' or 'query' must be provided")
+            return self._stream(chunksize, source or self.table or "query")
+        
         try:
-            engine = create_engine(self.connection_string)
+            from sqlalchemy import text
+            engine = self._get_engine()
             
             if self.query:
                 # Use custom query
-                df = pd.read_sql(text(self.query), engine)
+                df = pd.read_sql(text(self.query), engine, **self._dtype_backend_kwargs())
             else:
                 # Use table name
                 if not self.table:
                     raise ValueError("Either 'table' or 'query' must be provided")
-                df = pd.read_sql_table(self.table, engine)
+                df = pd.read_sql_table(self.table, engine, **self._dtype_backend_kwargs())
             
             self._update_metadata(source or self.table or "query", df)
             return df
@@ -44,11 +89,33 @@ class PostgreSQLConnector(BaseConnector):
         except Exception as e:
             raise DataLoadError(self.database, str(e))
     
+    def _stream(self, chunksize: int, source: str) -> Iterator[pd.DataFrame]:
+        """Yield result chunks from a server-side cursor."""
+        rows = 0
+        columns = []
+        try:
+            from sqlalchemy import text
+            with self._get_engine().connect() as conn:
+                conn = conn.execution_options(stream_results=True)
+                if self.query:
+                    chunks = pd.read_sql(text(self.query), conn, chunksize=chunksize,
+                                         **self._dtype_backend_kwargs())
+                else:
+                    chunks = pd.read_sql_table(self.table, conn, chunksize=chunksize,
+                                               **self._dtype_backend_kwargs())
+                for chunk in chunks:
+                    rows += len(chunk)
+                    columns = chunk.columns.tolist()
+                    yield chunk
+        except Exception as e:
+            raise DataLoadError(self.database, str(e))
+        self._update_metadata(source, pd.DataFrame(), rows=rows, columns=columns)
+    
     def validate(self, source: str = None) -> bool:
         """Check if PostgreSQL is accessible."""
         try:
-            engine = create_engine(self.connection_string)
-            with engine.connect() as conn:
+            from sqlalchemy import text
+            with self._get_engine().connect() as conn:
                 conn.execute(text("SELECT 1"))
             return True
         except:
@@ -57,8 +124,8 @@ class PostgreSQLConnector(BaseConnector):
     def get_tables(self) -> list:
         """List all tables in the database."""
         try:
-            engine = create_engine(self.connection_string)
-            inspector = sqlalchemy.inspect(engine)
+            from sqlalchemy import inspect
+            inspector = inspect(self._get_engine())
             return inspector.get_table_names()
         except Exception as e:
             raise DataLoadError(self.database, f"Failed to list tables: {e}")
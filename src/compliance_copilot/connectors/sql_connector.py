@@ -1,8 +1,7 @@
 """SQL database connector."""
 
 import pandas as pd
-from typing import Optional, Dict, Any
-from sqlalchemy import create_engine, text
+from typing import Optional, Dict, Any, Iterator, Union
 
 from .base import BaseConnector
 from .exceptions import DataLoadError
@@ -18,31 +17,92 @@ class SQLConnector(BaseConnector):
         query: "SELECT * FROM users"
     """
     
+    is_file_based = False
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config or {})
         self.connection_string = self.config.get("connection_string")
         self.query = self.config.get("query")
+        # Rows per DataFrame when streaming; None loads everything at once
+        self.chunksize = self.config.get("chunksize")
         
         if not self.connection_string:
             raise ValueError("SQLConnector requires 'connection_string' in config")
         if not self.query:
             raise ValueError("SQLConnector requires 'query' in config")
+        
+        # Pooled engine, created on first use and reused by every load
+        self._engine = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.dispose()
+    
+    def dispose(self):
+        """Close all pooled connections."""
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+    
+    def _get_engine(self):
+        if self._engine is None:
+            # SQLAlchemy is slow to import, so it is only loaded once a query runs
+            from sqlalchemy import create_engine
+            
+            # Pool sizing only applies to QueuePool-backed URLs, so it is
+            # passed through only when configured
+            pool_options = {
+                key: self.config[key] for key in ('pool_size', 'max_overflow') if key in self.config
+            }
+            self._engine = create_engine(
+                self.connection_string,
+                pool_pre_ping=True,
+                pool_recycle=1800,
+                **pool_options
+            )
+        return self._engine
     
-    def load(self, source: str = None, **kwargs) -> pd.DataFrame:
-        """source parameter is ignored; uses config query."""
+    def load(self, source: str = None, chunksize: Optional[int] = None,
+             **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """source parameter is ignored; uses config query.
+        
+        With a chunksize (argument or config) results are streamed and an
+        iterator of DataFrames is returned.
+        """
+        chunksize = chunksize or self.chunksize
+        if chunksize:
+            return self._stream(chunksize)
         try:
-            engine = create_engine(self.connection_string)
-            df = pd.read_sql(text(self.query), engine)
+            from sqlalchemy import text
+            df = pd.read_sql(text(self.query), self._get_engine(), **self._dtype_backend_kwargs())
             self._update_metadata("sql_query", df, query=self.query)
             return df
         except Exception as e:
             raise DataLoadError("SQL query", str(e))
     
+    def _stream(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Yield result chunks using a server-side cursor where supported."""
+        rows = 0
+        columns = []
+        try:
+            from sqlalchemy import text
+            with self._get_engine().connect() as conn:
+                conn = conn.execution_options(stream_results=True)
+                for chunk in pd.read_sql(text(self.query), conn, chunksize=chunksize,
+                                         **self._dtype_backend_kwargs()):
+                    rows += len(chunk)
+                    columns = chunk.columns.tolist()
+                    yield chunk
+        except Exception as e:
+            raise DataLoadError("SQL query", str(e))
+        self._update_metadata("sql_query", pd.DataFrame(), rows=rows, columns=columns, query=self.query)
+    
     def validate(self, source: str = None) -> bool:
         """Check if we can connect to the database."""
         try:
-            engine = create_engine(self.connection_string)
-            with engine.connect() as conn:
+            with self._get_engine().connect():
                 return True
         except:
             return False
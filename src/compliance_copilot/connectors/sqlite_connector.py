@@ -1,11 +1,23 @@
 """SQLite connector for Compliance Copilot."""
 import pandas as pd
-import sqlite3
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, Union
 from .base import BaseConnector
 from .exceptions import FileNotFoundError, DataLoadError
 
+# Applied to every new connection: memory-map up to 256 MiB of the file,
+# keep ~200 MB of page cache and build temporary indexes in memory
+_PRAGMAS = (
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-200000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+def _quote_identifier(name: str) -> str:
+    """Quote a table name for SQL, doubling embedded quotes."""
+    return '"' + name.replace('"', '""') + '"'
+
+
 class SQLiteConnector(BaseConnector):
     """Reads data from SQLite databases."""
     
@@ -14,36 +26,87 @@ class SQLiteConnector(BaseConnector):
         self.database = self.config.get('database')
         self.table = self.config.get('table')
         self.query = self.config.get('query')
+        # Rows per DataFrame when streaming; None loads everything at once
+        self.chunksize = self.config.get('chunksize')
         
         if not self.database:
             raise ValueError("SQLiteConnector requires 'database' in config")
+        
+        # Read-only connection, opened on first use and shared by every load
+        self._conn = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def close(self):
+        """Close the shared connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def _get_conn(self):
+        if self._conn is None:
+            import sqlite3
+            
+            # mode=ro skips write-journal setup and guarantees we never modify the file
+            uri = Path(self.database).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
+            self._conn = conn
+        return self._conn
     
-    def load(self, source: str = None, **kwargs) -> pd.DataFrame:
-        """Load data from SQLite table or query."""
+    def load(self, source: str = None, chunksize: Optional[int] = None,
+             **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """Load data from SQLite table or query.
+        
+        With a chunksize (argument or config) an iterator of DataFrames is
+        returned instead, so memory stays bounded for large tables.
+        """
         db_path = Path(self.database)
         
         if not db_path.exists():
             raise FileNotFoundError(str(db_path))
         
+        chunksize = chunksize or self.chunksize
         try:
-            conn = sqlite3.connect(str(db_path))
-            
             if self.query:
                 # Use custom query
-                df = pd.read_sql_query(self.query, conn)
+                sql = self.query
             else:
                 # Use table name
                 if not self.table:
                     raise ValueError("Either 'table' or 'query' must be provided")
-                df = pd.read_sql_query(f"SELECT * FROM {self.table}", conn)
+                # Quoted, so the configured name can't inject SQL
+                sql = f"SELECT * FROM {_quote_identifier(self.table)}"
+            
+            conn = self._get_conn()
+            if chunksize:
+                return self._stream(conn, sql, chunksize, source or self.table or "query")
             
-            conn.close()
+            df = pd.read_sql_query(sql, conn, **self._dtype_backend_kwargs())
             self._update_metadata(source or self.table or "query", df)
             return df
             
         except Exception as e:
             raise DataLoadError(self.database, str(e))
     
+    def _stream(self, conn, sql: str, chunksize: int, source: str) -> Iterator[pd.DataFrame]:
+        """Yield query results chunk by chunk."""
+        rows = 0
+        columns = []
+        try:
+            for chunk in pd.read_sql_query(sql, conn, chunksize=chunksize, **self._dtype_backend_kwargs()):
+                rows += len(chunk)
+                columns = chunk.columns.tolist()
+                yield chunk
+        except Exception as e:
+            raise DataLoadError(self.database, str(e))
+        self._update_metadata(source, pd.DataFrame(), rows=rows, columns=columns)
+    
     def validate(self, source: str = None) -> bool:
         """Check if SQLite database exists and is readable."""
         db_path = Path(self.database)
@@ -51,8 +114,7 @@ class SQLiteConnector(BaseConnector):
             return False
         
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.close()
+            self._get_conn()
             return True
         except:
             return False
@@ -60,11 +122,7 @@ class SQLiteConnector(BaseConnector):
     def get_tables(self) -> list:
         """List all tables in the database."""
         try:
-            conn = sqlite3.connect(self.database)
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [row[0] for row in cursor.fetchall()]
-            conn.close()
-            return tables
+            cursor = self._get_conn().execute("SELECT name FROM sqlite_master WHERE type='table';")
+            return [row[0] for row in cursor.fetchall()]
         except Exception as e:
             raise DataLoadError(self.database, f"Failed to list tables: {e}")
@@ -1,10 +1,11 @@
 """Rule engine core."""
 
-from .rule_engine import RuleEngine
+from .rule_engine import DataCache, RuleEngine
 from .models import Rule, RuleResult, Severity, RuleStatus
 
 __all__ = [
     'RuleEngine',
+    'DataCache',
     'Rule',
     'RuleResult',
     'Severity',
@@ -1,10 +1,371 @@
 """Safely evaluate rule conditions."""
 
+import ast
 import operator
-from typing import Dict, Any
+from functools import lru_cache, reduce
+from types import CodeType
+from typing import Callable, Dict, Any, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 
 
+class _Unsupported(Exception):
+    """Condition uses syntax that has no column-wise equivalent."""
+
+
+_COMPARE_OPS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+}
+
+_CONSTANTS = {'True': True, 'False': False}
+
+# Row-by-row evaluation follows Python semantics exactly, so it can take
+# the operators that have no safe column-wise form. Division is one of them:
+# a zero denominator raises and fails the row, where columns give inf/nan
+_ROW_COMPARE_OPS = {
+    **_COMPARE_OPS,
+    ast.In: lambda a, b: a in b,
+    ast.NotIn: lambda a, b: a not in b,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+}
+
+_ROW_BINARY_OPS = {
+    **_BINARY_OPS,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+_ROW_UNARY_OPS = {
+    ast.Not: operator.not_,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+    ast.Invert: operator.invert,
+}
+
+
+def _build(node: ast.AST) -> Callable[[pd.DataFrame], Any]:
+    """Translate a condition AST into a function over whole columns.
+    
+    Only constructs whose column-wise result matches the row-by-row result
+    are accepted; anything else raises _Unsupported.
+    """
+    if isinstance(node, ast.Constant):
+        if node.value is None:
+            # Row-wise, None == None is True; column-wise it never matches
+            raise _Unsupported("None")
+        value = node.value
+        return lambda df: value
+    
+    if isinstance(node, ast.Name):
+        if node.id in _CONSTANTS:
+            value = _CONSTANTS[node.id]
+            return lambda df: value
+        if node.id == 'None':
+            raise _Unsupported("None")
+        name = node.id
+        return lambda df: df[name]
+    
+    if isinstance(node, ast.BoolOp):
+        combine = operator.and_ if isinstance(node.op, ast.And) else operator.or_
+        parts = [_build(value) for value in node.values]
+        return lambda df: reduce(combine, (part(df) for part in parts))
+    
+    if isinstance(node, ast.UnaryOp):
+        operand = _build(node.operand)
+        if isinstance(node.op, ast.Not):
+            def negate(df):
+                value = operand(df)
+                return (not value) if isinstance(value, bool) else ~value
+            return negate
+        if isinstance(node.op, ast.USub):
+            return lambda df: -operand(df)
+        raise _Unsupported(type(node.op).__name__)
+    
+    if isinstance(node, ast.BinOp):
+        op = _BINARY_OPS.get(type(node.op))
+        if op is None:
+            raise _Unsupported(type(node.op).__name__)
+        left, right = _build(node.left), _build(node.right)
+        return lambda df: op(left(df), right(df))
+    
+    if isinstance(node, ast.Compare):
+        terms = [node.left] + list(node.comparators)
+        checks = []
+        for op, left_node, right_node in zip(node.ops, terms, terms[1:]):
+            if isinstance(op, (ast.In, ast.NotIn)):
+                checks.append(_build_membership(op, left_node, right_node))
+                continue
+            compare = _COMPARE_OPS.get(type(op))
+            if compare is None:
+                raise _Unsupported(type(op).__name__)
+            left, right = _build(left_node), _build(right_node)
+            checks.append(lambda df, c=compare, l=left, r=right: c(l(df), r(df)))
+        return lambda df: reduce(operator.and_, (check(df) for check in checks))
+    
+    raise _Unsupported(type(node).__name__)
+
+
+def _build_membership(op: ast.cmpop, left_node: ast.AST, right_node: ast.AST) -> Callable:
+    """``column in [literal, ...]`` becomes Series.isin."""
+    if not isinstance(left_node, ast.Name) or left_node.id in _CONSTANTS:
+        raise _Unsupported("in")
+    if not isinstance(right_node, (ast.List, ast.Tuple, ast.Set)):
+        raise _Unsupported("in")
+    try:
+        values = [ast.literal_eval(element) for element in right_node.elts]
+    except ValueError:
+        raise _Unsupported("in")
+    if any(value is None for value in values):
+        raise _Unsupported("None")
+    
+    name = left_node.id
+    if isinstance(op, ast.In):
+        return lambda df: df[name].isin(values)
+    return lambda df: ~df[name].isin(values)
+
+
+def _build_row(node: ast.AST) -> Callable[[Dict[str, Any]], Any]:
+    """Translate a condition AST into a function over a single row.
+    
+    Mirrors what eval() would compute, including short-circuiting and/or
+    and chained comparisons. Attribute access, calls and other constructs
+    raise _Unsupported and are left to eval().
+    """
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda row: value
+    
+    if isinstance(node, ast.Name):
+        name = node.id
+        return lambda row: row[name]
+    
+    if isinstance(node, ast.BoolOp):
+        parts = [_build_row(value) for value in node.values]
+        if isinstance(node.op, ast.And):
+            def all_of(row):
+                for part in parts:
+                    value = part(row)
+                    if not value:
+                        return value
+                return value
+            return all_of
+        
+        def any_of(row):
+            for part in parts:
+                value = part(row)
+                if value:
+                    return value
+            return value
+        return any_of
+    
+    if isinstance(node, ast.UnaryOp):
+        op = _ROW_UNARY_OPS.get(type(node.op))
+        if op is None:
+            raise _Unsupported(type(node.op).__name__)
+        operand = _build_row(node.operand)
+        return lambda row: op(operand(row))
+    
+    if isinstance(node, ast.BinOp):
+        op = _ROW_BINARY_OPS.get(type(node.op))
+        if op is None:
+            raise _Unsupported(type(node.op).__name__)
+        left, right = _build_row(node.left), _build_row(node.right)
+        return lambda row: op(left(row), right(row))
+    
+    if isinstance(node, ast.Compare):
+        ops = []
+        for op in node.ops:
+            compare = _ROW_COMPARE_OPS.get(type(op))
+            if compare is None:
+                raise _Unsupported(type(op).__name__)
+            ops.append(compare)
+        first = _build_row(node.left)
+        rest = [_build_row(comparator) for comparator in node.comparators]
+        
+        if len(ops) == 1:
+            compare, second = ops[0], rest[0]
+            return lambda row: compare(first(row), second(row))
+        
+        def chained(row):
+            left = first(row)
+            for compare, term in zip(ops, rest):
+                right = term(row)
+                result = compare(left, right)
+                if not result:
+                    return result
+                left = right
+            return result
+        return chained
+    
+    if isinstance(node, ast.IfExp):
+        test, body, orelse = _build_row(node.test), _build_row(node.body), _build_row(node.orelse)
+        return lambda row: body(row) if test(row) else orelse(row)
+    
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        if any(isinstance(element, ast.Starred) for element in node.elts):
+            raise _Unsupported("Starred")
+        elements = [_build_row(element) for element in node.elts]
+        container = {ast.List: list, ast.Tuple: tuple, ast.Set: set}[type(node)]
+        return lambda row: container([element(row) for element in elements])
+    
+    raise _Unsupported(type(node).__name__)
+
+
+@lru_cache(maxsize=None)
+def compile_row(condition: str) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    """Compile a condition for per-row evaluation, or None to use eval()."""
+    try:
+        return _build_row(ast.parse(condition, mode='eval').body)
+    except (SyntaxError, _Unsupported):
+        return None
+
+
+@lru_cache(maxsize=None)
+def compile_vectorized(condition: str) -> Optional[Callable[[pd.DataFrame], Any]]:
+    """Compile a condition for whole-frame evaluation, or None if it can't be."""
+    try:
+        return _build(ast.parse(condition, mode='eval').body)
+    except (SyntaxError, _Unsupported):
+        return None
+
+
+_KERNEL_COMPARE_OPS = {
+    ast.Eq: '==', ast.NotEq: '!=', ast.Lt: '<', ast.LtE: '<=', ast.Gt: '>', ast.GtE: '>=',
+}
+
+# No division: like the column-wise path, a zero denominator must fail the
+# row rather than yield inf/nan
+_KERNEL_BINARY_OPS = {ast.Add: '+', ast.Sub: '-', ast.Mult: '*'}
+
+
+def _kernel_source(node: ast.AST, names: List[str]) -> Tuple[str, bool]:
+    """Render a numeric condition as a scalar expression over ``cN[i]``.
+    
+    Returns the source and whether it is boolean. Only comparisons of
+    numeric operands combined with and/or/not are accepted, so the kernel
+    agrees with the column-wise result.
+    """
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise _Unsupported("constant")
+        return repr(node.value), False
+    
+    if isinstance(node, ast.Name):
+        if node.id not in names:
+            names.append(node.id)
+        return f"c{names.index(node.id)}[i]", False
+    
+    if isinstance(node, ast.BoolOp):
+        parts = [_kernel_source(value, names) for value in node.values]
+        if not all(is_bool for _, is_bool in parts):
+            raise _Unsupported("non-boolean operand")
+        joiner = ' and ' if isinstance(node.op, ast.And) else ' or '
+        return '(' + joiner.join(src for src, _ in parts) + ')', True
+    
+    if isinstance(node, ast.UnaryOp):
+        src, is_bool = _kernel_source(node.operand, names)
+        if isinstance(node.op, ast.Not) and is_bool:
+            return f"(not {src})", True
+        if isinstance(node.op, ast.USub) and not is_bool:
+            return f"(-{src})", False
+        raise _Unsupported(type(node.op).__name__)
+    
+    if isinstance(node, ast.BinOp):
+        op = _KERNEL_BINARY_OPS.get(type(node.op))
+        left, left_bool = _kernel_source(node.left, names)
+        right, right_bool = _kernel_source(node.right, names)
+        if op is None or left_bool or right_bool:
+            raise _Unsupported(type(node.op).__name__)
+        return f"({left} {op} {right})", False
+    
+    if isinstance(node, ast.Compare):
+        terms = [_kernel_source(term, names) for term in [node.left] + list(node.comparators)]
+        if any(is_bool for _, is_bool in terms):
+            raise _Unsupported("boolean comparison")
+        checks = []
+        for op, (left, _), (right, _) in zip(node.ops, terms, terms[1:]):
+            symbol = _KERNEL_COMPARE_OPS.get(type(op))
+            if symbol is None:
+                raise _Unsupported(type(op).__name__)
+            checks.append(f"({left} {symbol} {right})")
+        return '(' + ' and '.join(checks) + ')', True
+    
+    raise _Unsupported(type(node).__name__)
+
+
+@lru_cache(maxsize=None)
+def compile_numba(condition: str) -> Optional[Tuple[Callable, Tuple[str, ...]]]:
+    """JIT-compile a purely numeric condition into a parallel mask kernel.
+    
+    Returns the kernel and the column names it takes, in argument order,
+    or None when numba is missing or the condition is not purely numeric.
+    Numba specializes the kernel per column dtype on first call.
+    """
+    try:
+        # Imported here: numba takes well over 100ms to import
+        import numba
+    except ImportError:
+        return None
+    try:
+        names = []
+        body, is_bool = _kernel_source(ast.parse(condition, mode='eval').body, names)
+    except (SyntaxError, _Unsupported):
+        return None
+    if not is_bool or not names:
+        return None
+    
+    args = ', '.join(f"c{n}" for n in range(len(names)))
+    source = (
+        f"def kernel({args}, out):\n"
+        f"    for i in prange(out.shape[0]):\n"
+        f"        out[i] = {body}\n"
+    )
+    namespace = {'prange': numba.prange}
+    exec(source, namespace)
+    kernel = numba.njit(parallel=True, cache=False)(namespace['kernel'])
+    return kernel, tuple(names)
+
+
+def _evaluate_numba(condition: str, data: pd.DataFrame) -> Optional[pd.Series]:
+    """Run a compiled numba kernel over data, or None if it doesn't apply."""
+    compiled = compile_numba(condition)
+    if compiled is None:
+        return None
+    kernel, names = compiled
+    
+    columns = []
+    for name in names:
+        if name not in data.columns:
+            return None
+        column = data[name]
+        # Plain numpy ints/floats only; nullable and object columns keep
+        # their pandas semantics
+        if not isinstance(column.dtype, np.dtype) or column.dtype.kind not in 'iuf':
+            return None
+        columns.append(column.to_numpy())
+    
+    out = np.empty(len(data), dtype=np.bool_)
+    try:
+        kernel(*columns, out)
+    except Exception:
+        return None
+    return pd.Series(out, index=data.index)
+
+
 class ExpressionEvaluator:
     """Safely evaluates rule conditions against data rows."""
     
@@ -26,47 +387,109 @@ class ExpressionEvaluator:
         '/': operator.truediv,
     }
     
-    def __init__(self, debug: bool = False):
+    # Everything except the row itself never changes, so it is built once
+    # and passed to eval() as globals; the row dict serves as locals
+    _globals = {
+        '__builtins__': {},
+        'True': True,
+        'False': False,
+        'None': None,
+        **_operators,
+    }
+    
+    def __init__(self, debug: bool = False, engine: Optional[str] = None):
         self.debug = debug
+        # None: column-wise Python ops; "numexpr": fused numexpr kernels;
+        # "numba": JIT-compiled loops for numeric conditions;
+        # "python": plain row-by-row evaluation (useful when debugging)
+        self.engine = engine
+        if debug:
+            # Chosen once here so the per-row path never tests self.debug
+            self.evaluate = self._evaluate_debug
     
-    def evaluate(self, condition: str, row: Dict[str, Any]) -> bool:
-        """Evaluate condition against a single row."""
-        if self.debug:
-            print(f"  Evaluating: {condition}")
-            print(f"  Row data: {row}")
+    def _evaluate_fast(self, condition: str, row: Dict[str, Any], code: Optional[CodeType] = None) -> bool:
+        """Evaluate condition against a single row.
         
+        ``code`` is the condition pre-compiled with ``compile(..., 'eval')``;
+        when given it is run instead of re-parsing the string.
+        """
         try:
-            # Create safe evaluation context
-            context = self._create_context(row)
-            result = eval(condition, {"__builtins__": {}}, context)
-            
-            if self.debug:
-                print(f"  Result: {result}")
+            fn = compile_row(condition)
+            if fn is not None:
+                # Names are looked up straight in the row, no context needed
+                return bool(fn(row))
+            return bool(eval(code if code is not None else condition, self._globals, self._create_context(row)))
+        except Exception:
+            return False
+    
+    # Debug evaluators swap in _evaluate_debug per instance
+    evaluate = _evaluate_fast
+    
+    def _evaluate_debug(self, condition: str, row: Dict[str, Any], code: Optional[CodeType] = None) -> bool:
+        """Same as evaluate, printing the row, the result and any error."""
+        print(f"  Evaluating: {condition}")
+        print(f"  Row data: {row}")
+        
+        try:
+            fn = compile_row(condition)
+            if fn is not None:
+                result = fn(row)
+            else:
+                result = eval(code if code is not None else condition, self._globals, self._create_context(row))
             
+            print(f"  Result: {result}")
             return bool(result)
             
         except Exception as e:
-            if self.debug:
-                print(f"  Error: {e}")
+            print(f"  Error: {e}")
             return False
     
+    def evaluate_vectorized(self, condition: str, data: pd.DataFrame,
+                            code: Optional[CodeType] = None) -> pd.Series:
+        """Evaluate condition against every row at once, returning a boolean mask.
+        
+        Falls back to row-by-row evaluation for conditions (or data) the
+        column-wise path can't handle, with engine="python", and always in
+        debug mode so each row is still printed.
+        """
+        fn = None if self.debug or self.engine == "python" else compile_vectorized(condition)
+        if fn is not None:
+            try:
+                mask = None
+                if self.engine == "numexpr":
+                    # Only conditions that compiled above reach numexpr, so
+                    # its result agrees with the row-by-row semantics; '/'
+                    # never compiles, as numexpr would turn x/0 into inf
+                    try:
+                        mask = data.eval(condition, engine="numexpr")
+                    except Exception:
+                        mask = None
+                elif self.engine == "numba":
+                    mask = _evaluate_numba(condition, data)
+                if mask is None:
+                    mask = fn(data)
+                if isinstance(mask, bool):
+                    return pd.Series(mask, index=data.index, dtype=bool)
+                if isinstance(mask, pd.Series) and pd.api.types.is_bool_dtype(mask.dtype):
+                    # Nullable/Arrow booleans: NA fails the row, as bool(NA) would
+                    return mask.fillna(False).astype(bool)
+            except Exception:
+                pass
+        
+        # Plain tuples avoid building a Series per row as iterrows() would
+        columns = data.columns.tolist()
+        return pd.Series(
+            [
+                self.evaluate(condition, dict(zip(columns, values)), code)
+                for values in data.itertuples(index=False, name=None)
+            ],
+            index=data.index,
+            dtype=bool
+        )
+    
     def _create_context(self, row: Dict[str, Any]) -> Dict[str, Any]:
-        """Create evaluation context from row data."""
+        """Create the eval() locals from row data; constants live in _globals."""
         # Convert pandas Series to dict if needed
         if isinstance(row, pd.Series):
-            row = row.to_dict()
-        
-        # Start with built-in constants
-        context = {
-            'True': True,
-            'False': False,
-            'None': None,
-        }
-        
-        # Add row data
-        context.update(row)
-        
-        # Add allowed operators
-        context.update(self._operators)
-        
-        return context
+            return row.to_dict()
+        return row
@@ -1,17 +1,26 @@
 """Data models for rules and results."""
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import List, Dict, Any, Optional
 
+# Slotted dataclasses drop the per-instance __dict__; dataclass() only
+# accepts slots= from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-class Severity(Enum):
-    """Rule severity levels."""
-    LOW = "LOW"
-    MEDIUM = "MEDIUM"
-    HIGH = "HIGH"
-    CRITICAL = "CRITICAL"
+
+class Severity(IntEnum):
+    """Rule severity levels, ordered so thresholds are plain int compares."""
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+
+
+# Name -> member, built once instead of going through Enum.__getitem__ per rule
+SEVERITY_BY_NAME = {member.name: member for member in Severity}
 
 
 class RuleStatus(Enum):
@@ -22,7 +31,7 @@ class RuleStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Rule:
     """A single compliance rule."""
     
@@ -41,6 +50,32 @@ class Rule:
     # Metadata
     created_at: datetime = field(default_factory=datetime.utcnow)
     
+    # Condition compiled to a code object at load time (see compile())
+    compiled_condition: Any = field(default=None, repr=False, compare=False)
+    
+    def compile(self):
+        """Compile the condition once so per-row evaluation skips parsing.
+        
+        Invalid conditions are left uncompiled; evaluating them fails the
+        row just as it did before.
+        """
+        try:
+            self.compiled_condition = compile(self.condition, f"<rule:{self.id}>", "eval")
+        except (SyntaxError, TypeError, ValueError):
+            self.compiled_condition = None
+    
+    def __getstate__(self):
+        # Code objects can't be pickled; workers recompile on arrival
+        state = {f.name: getattr(self, f.name) for f in fields(self)}
+        state["compiled_condition"] = None
+        return state
+    
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        if self.condition:
+            self.compile()
+    
     def validate(self) -> List[str]:
         """Validate rule definition."""
         errors = []
@@ -55,7 +90,7 @@ class Rule:
         return errors
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RuleResult:
     """Result of evaluating a rule."""
     
@@ -71,6 +106,8 @@ class RuleResult:
     
     # Details
     violations: List[Dict[str, Any]] = field(default_factory=list)
+    # True when failed_rows exceeds the violations kept
+    truncated: bool = False
     error_message: Optional[str] = None
     
     # Performance
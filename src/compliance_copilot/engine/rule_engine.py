@@ -1,24 +1,248 @@
 """Main rule engine that orchestrates everything."""
 
+import multiprocessing
+import os
+import threading
 import time
-from typing import List, Optional
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 from ..connectors.factory import ConnectorFactory
+from ..utils import list_files
 from .models import Rule, RuleResult, RuleStatus
 from .rule_parser import RuleParser
-from .expression_evaluator import ExpressionEvaluator
+from .expression_evaluator import ExpressionEvaluator, compile_vectorized
+
+
+# Below this many rules per source, process start-up costs more than it saves
+PARALLEL_MIN_RULES = 4
+
+# Rule evaluation runs in this process unless more workers are asked for:
+# a vectorized rule is usually cheaper than shipping its frame to a child
+DEFAULT_WORKERS = 1
+
+# Violations (with full row data) kept per rule; failed_rows still counts all
+DEFAULT_MAX_VIOLATIONS = 1000
+
+# Sources read concurrently; loading is mostly file/network IO
+DEFAULT_IO_WORKERS = 8
+
+# Memory budget for DataFrames kept between runs; off unless configured,
+# since only a cache that outlives one run (see DataCache) is ever hit
+DEFAULT_DATA_CACHE_MB = 0
+
+
+def _apply_filter(data: pd.DataFrame, expr: str, engine: Optional[str]) -> pd.DataFrame:
+    """Run a rule filter through DataFrame.query, retrying with the Python engine."""
+    if engine is None or engine == "numba":
+        # numba only drives conditions; query() picks its own default
+        return data.query(expr)
+    try:
+        return data.query(expr, engine=engine)
+    except Exception:
+        if engine == "python":
+            raise
+        # numexpr missing or unable to handle the expression
+        return data.query(expr, engine="python")
+
+
+def _fused_masks(data: pd.DataFrame, rule: Rule, evaluator: ExpressionEvaluator,
+                 engine: Optional[str]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Filter and pass masks over the whole frame, or None to filter first.
+    
+    Evaluating both over the unfiltered columns avoids copying the filtered
+    rows out; with numexpr, filter and condition run as one fused kernel.
+    Only conditions with an exact column-wise form qualify, since anything
+    else would be evaluated row by row over rows the filter drops. That
+    excludes division, which the fused kernel would turn into inf/nan
+    instead of failing the row.
+    """
+    if compile_vectorized(rule.condition) is None:
+        return None
+    try:
+        in_filter = data.eval(rule.filter, engine=engine if engine == "numexpr" else None)
+    except Exception:
+        return None
+    if not isinstance(in_filter, pd.Series) or in_filter.dtype != bool:
+        return None
+    in_filter = in_filter.to_numpy()
+    
+    if engine == "numexpr":
+        try:
+            passing = data.eval(f"({rule.filter}) & ({rule.condition})", engine="numexpr")
+            if isinstance(passing, pd.Series) and passing.dtype == bool:
+                return in_filter, passing.to_numpy()
+        except Exception:
+            pass
+    
+    mask = evaluator.evaluate_vectorized(rule.condition, data, rule.compiled_condition)
+    return in_filter, in_filter & mask.to_numpy()
+
+
+# Frame evaluated by a worker process, installed once per worker by _init_worker
+_worker_data = None
+
+
+def _init_worker(data: pd.DataFrame):
+    global _worker_data
+    _worker_data = data
+
+
+def _eval_rule_in_worker(task: Tuple[Rule, bool, Optional[str], int]) -> RuleResult:
+    """Evaluate a rule against the frame this worker was started with."""
+    rule, debug, engine, max_violations = task
+    return _eval_rule((rule, _worker_data, debug, engine, max_violations))
+
+
+def _eval_rule(task: Tuple[Rule, pd.DataFrame, bool, Optional[str], int]) -> RuleResult:
+    """Evaluate a single rule against data.
+    
+    Lives at module level so it can be pickled and shipped to worker processes.
+    """
+    rule, data, debug, engine, max_violations = task
+    evaluator = ExpressionEvaluator(debug=debug, engine=engine)
+    rule_start = time.time()
+    
+    result = RuleResult(
+        rule_id=rule.id,
+        rule_name=rule.name,
+        status=RuleStatus.PASS,
+        total_rows=len(data)
+    )
+    
+    try:
+        fused = None
+        if rule.filter and engine != "python" and not debug:
+            fused = _fused_masks(data, rule, evaluator, engine)
+        
+        if fused is not None:
+            in_filter, passing = fused
+            filtered_data = data
+            result.total_rows = int(in_filter.sum())
+            result.passed_rows = int(passing.sum())
+            failed_positions = np.flatnonzero(in_filter & ~passing)
+        else:
+            # Apply filter if specified
+            if rule.filter:
+                filtered_data = _apply_filter(data, rule.filter, engine)
+            else:
+                filtered_data = data
+            
+            result.total_rows = len(filtered_data)
+            
+            # Evaluate the condition over all rows at once
+            mask = evaluator.evaluate_vectorized(rule.condition, filtered_data, rule.compiled_condition)
+            result.passed_rows = int(mask.sum())
+            failed_positions = np.flatnonzero(~mask.to_numpy())
+        
+        result.failed_rows = len(failed_positions)
+        # Only the first max_violations failing rows are materialized as dicts
+        failing = filtered_data.iloc[failed_positions[:max_violations]]
+        result.violations = [
+            {"row_index": idx, "row_data": row_data}
+            for idx, row_data in zip(failing.index, failing.to_dict('records'))
+        ]
+        result.truncated = result.failed_rows > len(result.violations)
+        
+        if result.failed_rows > 0:
+            result.status = RuleStatus.FAIL
+        
+    except Exception as e:
+        result.status = RuleStatus.ERROR
+        result.error_message = str(e)
+    
+    result.execution_time_ms = (time.time() - rule_start) * 1000
+    return result
+
+
+def _merge_results(total: RuleResult, part: RuleResult, max_violations: int) -> RuleResult:
+    """Fold the result of one chunk into the running result for a rule."""
+    if total.status == RuleStatus.ERROR:
+        return total
+    if part.status == RuleStatus.ERROR:
+        return part
+    
+    total.total_rows += part.total_rows
+    total.passed_rows += part.passed_rows
+    total.failed_rows += part.failed_rows
+    total.execution_time_ms += part.execution_time_ms
+    room = max_violations - len(total.violations)
+    if room > 0:
+        total.violations.extend(part.violations[:room])
+    total.truncated = total.failed_rows > len(total.violations)
+    if total.failed_rows > 0:
+        total.status = RuleStatus.FAIL
+    return total
+
+
+class DataCache:
+    """Loaded DataFrames keyed by file identity, least recently used evicted first.
+    
+    Engines are built per scan, so long-running callers such as the
+    scheduler pass one cache to every engine they create.
+    """
+    
+    def __init__(self, max_mb: float = DEFAULT_DATA_CACHE_MB):
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        # (resolved path, mtime_ns, size) -> (DataFrame, bytes)
+        self._frames = OrderedDict()
+        self._used = 0
+        self._lock = threading.Lock()
+    
+    def key(self, source: str) -> Optional[Tuple[str, int, int]]:
+        """Identify a file's current contents, or None when caching is off."""
+        if self.max_bytes <= 0:
+            return None
+        try:
+            st = os.stat(source)
+        except OSError:
+            return None
+        # A rewritten file gets a new mtime/size and so a fresh entry
+        return (str(Path(source).resolve()), st.st_mtime_ns, st.st_size)
+    
+    def get(self, key: Tuple[str, int, int]) -> Optional[pd.DataFrame]:
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is None:
+                return None
+            self._frames.move_to_end(key)
+            return entry[0]
+    
+    def put(self, key: Tuple[str, int, int], data: pd.DataFrame):
+        """Remember a loaded frame, evicting least recently used ones over budget."""
+        nbytes = int(data.memory_usage(deep=True).sum())
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._frames:
+                return
+            self._frames[key] = (data, nbytes)
+            self._used += nbytes
+            while self._used > self.max_bytes:
+                _, (_, evicted) = self._frames.popitem(last=False)
+                self._used -= evicted
 
 
 class RuleEngine:
     """Main engine for evaluating compliance rules."""
     
-    def __init__(self, config: dict = None, debug: bool = False):
+    def __init__(self, config: dict = None, debug: bool = False, workers: Optional[int] = None,
+                 data_cache: Optional[DataCache] = None):
         self.config = config or {}
         self.debug = debug
+        self.workers = workers if workers is not None else DEFAULT_WORKERS
+        self.expression_engine = self.config.get('engine', {}).get('expression_engine')
+        self.max_violations = self.config.get('engine', {}).get('max_violations_per_rule', DEFAULT_MAX_VIOLATIONS)
+        self.io_workers = self.config.get('engine', {}).get('io_workers', DEFAULT_IO_WORKERS)
+        if data_cache is None:
+            data_cache = DataCache(self.config.get('engine', {}).get('data_cache_mb', DEFAULT_DATA_CACHE_MB))
+        self.data_cache = data_cache
         self.parser = RuleParser()
-        self.evaluator = ExpressionEvaluator(debug=debug)
+        self.evaluator = ExpressionEvaluator(debug=debug, engine=self.expression_engine)
         self.factory = ConnectorFactory(self.config.get('connectors', {}))
         
         self.stats = {
@@ -30,7 +254,52 @@ class RuleEngine:
     def run(self, rule_source: str, data_path: str) -> List[RuleResult]:
         """Run compliance checks."""
         start_time = time.time()
+        sources = self._group_rules(rule_source, data_path)
+        
+        # Execute rules
+        all_results = []
+        pending = deque()
+        lookahead = max(1, min(self.io_workers, len(sources)))
+        loader = ThreadPoolExecutor(max_workers=lookahead)
+        upcoming = iter(sources)
+        
+        def submit_next():
+            source = next(upcoming, None)
+            if source is None:
+                return
+            full_path, source_rules = source
+            if self.debug:
+                print(f"\nLoading data from: {full_path}")
+            
+            pending.append((full_path, source_rules, loader.submit(self._load_data, full_path)))
+        
+        try:
+            # Keep up to io_workers loads in flight so IO for later sources
+            # overlaps with evaluating earlier ones, without holding every
+            # source in memory at once; results are consumed in order
+            for _ in range(lookahead):
+                submit_next()
+            
+            while pending:
+                full_path, source_rules, loading = pending.popleft()
+                submit_next()
+                try:
+                    # Load data once for all rules using same source
+                    data = loading.result()
+                except Exception as e:
+                    all_results.extend(self._evaluate_source(full_path, source_rules, None, e))
+                else:
+                    all_results.extend(self._evaluate_source(full_path, source_rules, data))
+        finally:
+            for _, _, loading in pending:
+                loading.cancel()
+            loader.shutdown()
         
+        self.stats["total_execution_time"] = (time.time() - start_time) * 1000
+        return all_results
+    
+    def _group_rules(self, rule_source: str, data_path: str) -> List[Tuple[str, List[Rule]]]:
+        """Load rules and group them into (data path, rules) per distinct file."""
         # Load rules
         rules = self._load_rules(rule_source)
         self.stats["rules_loaded"] = len(rules)
@@ -39,46 +308,53 @@ class RuleEngine:
             print(f"Loaded {len(rules)} rules")
         
         # Group rules by data source
-        rules_by_source = {}
+        rules_by_source = defaultdict(list)
         for rule in rules:
-            if rule.data_source not in rules_by_source:
-                rules_by_source[rule.data_source] = []
             rules_by_source[rule.data_source].append(rule)
         
-        # Execute rules
-        all_results = []
-        
+        # Merge sources that resolve to the same file, so "./x.csv", "x.csv"
+        # and symlinks to it share a single load (one resolve per spelling)
+        rules_by_file = defaultdict(list)
+        paths = {}
         for source, source_rules in rules_by_source.items():
-            # Resolve full path
             full_path = str(Path(data_path) / source)
-            
-            if self.debug:
-                print(f"\nLoading data from: {full_path}")
-            
+            key = str(Path(full_path).resolve())
+            paths.setdefault(key, full_path)
+            rules_by_file[key].extend(source_rules)
+        
+        return [(paths[key], source_rules) for key, source_rules in rules_by_file.items()]
+    
+    def _evaluate_source(self, full_path: str, rules: List[Rule], data,
+                         load_error: Optional[Exception] = None) -> List[RuleResult]:
+        """Evaluate one source's rules, or mark them all ERROR if it failed to load."""
+        if load_error is None:
             try:
-                # Load data once for all rules using same source
-                data = self._load_data(full_path)
-                
-                # Apply each rule
-                for rule in source_rules:
-                    result = self._evaluate_rule(rule, data)
-                    all_results.append(result)
-                    
+                # Streamed sources are read during evaluation, so their
+                # read errors surface here too
+                results = None if isinstance(data, pd.DataFrame) else self._evaluate_chunks(rules, data)
             except Exception as e:
-                if self.debug:
-                    print(f"Error loading {full_path}: {e}")
-                
-                for rule in source_rules:
-                    result = RuleResult(
-                        rule_id=rule.id,
-                        rule_name=rule.name,
-                        status=RuleStatus.ERROR,
-                        error_message=str(e)
-                    )
-                    all_results.append(result)
+                load_error = e
         
-        self.stats["total_execution_time"] = (time.time() - start_time) * 1000
-        return all_results
+        if load_error is not None:
+            if self.debug:
+                print(f"Error loading {full_path}: {load_error}")
+            
+            return [
+                RuleResult(
+                    rule_id=rule.id,
+                    rule_name=rule.name,
+                    status=RuleStatus.ERROR,
+                    error_message=str(load_error)
+                )
+                for rule in rules
+            ]
+        
+        if results is None:
+            results = self._evaluate_frame(rules, data)
+        
+        for result in results:
+            self._record_stats(result)
+        return results
     
     def _load_rules(self, rule_source: str) -> List[Rule]:
         """Load rules from file or directory."""
@@ -88,69 +364,85 @@ class RuleEngine:
             return self.parser.parse_file(str(path))
         elif path.is_dir():
             rules = []
-            for rule_file in path.glob("*.yaml"):
+            for rule_file in list_files(str(path), ".yaml"):
                 rules.extend(self.parser.parse_file(str(rule_file)))
             return rules
         else:
             raise FileNotFoundError(f"Rule source not found: {rule_source}")
     
+    def _evaluate_frame(self, rules: List[Rule], data: pd.DataFrame) -> List[RuleResult]:
+        """Apply each rule, fanning out to worker processes when asked to.
+        
+        Debug mode always stays serial so its per-row output comes from
+        this process, in rule order.
+        """
+        if self.workers > 1 and not self.debug and len(rules) >= PARALLEL_MIN_RULES:
+            return self._evaluate_parallel(rules, data)
+        return [
+            _eval_rule((rule, data, self.debug, self.expression_engine, self.max_violations))
+            for rule in rules
+        ]
+    
+    def _evaluate_parallel(self, rules: List[Rule], data: pd.DataFrame) -> List[RuleResult]:
+        """Split rules across worker processes that each receive the frame once."""
+        workers = min(self.workers, len(rules))
+        tasks = [(rule, self.debug, self.expression_engine, self.max_violations) for rule in rules]
+        # Loader threads may be running; forking then could copy a held lock
+        # into the child, so workers come from a forkserver
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver") if "forkserver" in methods else None
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(data,)) as pool:
+            chunksize = -(-len(tasks) // workers)
+            return list(pool.map(_eval_rule_in_worker, tasks, chunksize=chunksize))
+    
+    def _evaluate_chunks(self, rules: List[Rule], chunks: Iterable[pd.DataFrame]) -> List[RuleResult]:
+        """Evaluate rules over a stream of DataFrames, accumulating counts per rule."""
+        merged = None
+        offset = 0
+        for chunk in chunks:
+            # Chunks each restart at 0; renumber so row_index stays unique
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            results = self._evaluate_frame(rules, chunk)
+            if merged is None:
+                merged = results
+            else:
+                merged = [
+                    _merge_results(total, part, self.max_violations)
+                    for total, part in zip(merged, results)
+                ]
+        
+        if merged is None:
+            # Empty result set
+            merged = self._evaluate_frame(rules, pd.DataFrame())
+        return merged
+    
     def _load_data(self, source: str) -> pd.DataFrame:
-        """Load data using appropriate connector."""
+        """Load data using appropriate connector, reusing unchanged files."""
+        key = self.data_cache.key(source)
+        if key is not None:
+            data = self.data_cache.get(key)
+            if data is not None:
+                return data
+        
         connector = self.factory.get_connector(source)
-        return connector.load(source)
+        data = connector.load(source)
+        if key is not None and isinstance(data, pd.DataFrame):
+            self.data_cache.put(key, data)
+        return data
     
     def _evaluate_rule(self, rule: Rule, data: pd.DataFrame) -> RuleResult:
         """Evaluate a single rule against data."""
-        rule_start = time.time()
-        
-        result = RuleResult(
-            rule_id=rule.id,
-            rule_name=rule.name,
-            status=RuleStatus.PASS,
-            total_rows=len(data)
-        )
-        
-        try:
-            # Apply filter if specified
-            if rule.filter:
-                filtered_data = data.query(rule.filter)
-            else:
-                filtered_data = data
-            
-            result.total_rows = len(filtered_data)
-            
-            # Evaluate each row
-            violations = []
-            passed = 0
-            
-            for idx, row in filtered_data.iterrows():
-                passes = self.evaluator.evaluate(rule.condition, row.to_dict())
-                
-                if passes:
-                    passed += 1
-                else:
-                    violations.append({
-                        "row_index": idx,
-                        "row_data": row.to_dict()
-                    })
-            
-            result.passed_rows = passed
-            result.failed_rows = len(violations)
-            result.violations = violations
-            
-            if result.failed_rows > 0:
-                result.status = RuleStatus.FAIL
-            
+        result = _eval_rule((rule, data, self.debug, self.expression_engine, self.max_violations))
+        self._record_stats(result)
+        return result
+    
+    def _record_stats(self, result: RuleResult):
+        """Fold a finished rule result into engine statistics."""
+        if result.status != RuleStatus.ERROR:
             self.stats["total_rows_processed"] += result.total_rows
-            
-        except Exception as e:
-            result.status = RuleStatus.ERROR
-            result.error_message = str(e)
-        
-        result.execution_time_ms = (time.time() - rule_start) * 1000
         self.stats["rules_executed"] += 1
-        
-        return result
     
     def get_stats(self):
         """Get engine statistics."""
@@ -1,14 +1,17 @@
 """Parse YAML rule files into Rule objects."""
 
-import yaml
 from pathlib import Path
 from typing import List, Dict, Any
-from .models import Rule, Severity
+from .models import Rule, SEVERITY_BY_NAME
 
 
 class RuleParser:
     """Parses YAML rule definitions into Rule objects."""
     
+    # libyaml-backed loader when PyYAML was built with it; resolved on the
+    # first parse so importing the engine doesn't pull in PyYAML
+    _loader = None
+    
     def __init__(self):
         self.defaults = {
             "severity": "MEDIUM",
@@ -22,8 +25,12 @@ class RuleParser:
         if not path.exists():
             raise FileNotFoundError(f"Rule file not found: {file_path}")
         
+        import yaml
+        if RuleParser._loader is None:
+            RuleParser._loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        
         with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=RuleParser._loader)
         
         if not data:
             return []
@@ -47,6 +54,8 @@ class RuleParser:
         
         # Convert string severity to Enum
         if 'severity' in rule_dict and isinstance(rule_dict['severity'], str):
-            rule_dict['severity'] = Severity[rule_dict['severity'].upper()]
+            rule_dict['severity'] = SEVERITY_BY_NAME[rule_dict['severity'].strip().upper()]
         
-        return Rule(**rule_dict)
+        rule = Rule(**rule_dict)
+        rule.compile()
+        return rule
@@ -14,6 +14,8 @@ Example:
         print(f"Any app error: {e}")
 """
 
+from itertools import islice
+
 # ─── BASE EXCEPTION ──────────────────────────────────────────
 
 class ComplianceCopilotError(Exception):
@@ -321,35 +323,58 @@ class RuleExecutionError(RuleError):
         - Type error (comparing string to number)
     """
     
+    # Columns kept from the offending row
+    SAMPLE_COLUMNS = 5
+    
     def __init__(self, rule_id: str, condition: str, error: str, 
-                 row_data: dict = None):
+                 row_data: dict = None, row_sample: dict = None):
         """Create execution error.
         
         Args:
             rule_id: Which rule failed
             condition: The condition that failed
             error: What went wrong
-            row_data: The data row that caused the failure
+            row_data: The data row that caused the failure; only its first
+                few columns are kept
+            row_sample: An already sampled row, kept as-is; used instead of
+                row_data when given
         """
         self.rule_id = rule_id
         self.condition = condition
-        
-        message = f"Rule '{rule_id}' failed during execution: {error}\n"
-        message += f"Condition: {condition}"
-        
+        self.error = error
+        if row_sample is None and row_data:
+            row_sample = dict(islice(row_data.items(), self.SAMPLE_COLUMNS))
+        self.sample_row = row_sample or None
+        # This error can be raised once per failing row, so the message and
+        # details are only built if someone reads them; skip the base __init__
+        # that would assign them eagerly. args mirrors the signature so the
+        # sample survives pickling (e.g. back from a worker process)
+        super(ComplianceCopilotError, self).__init__(rule_id, condition, error, None, self.sample_row)
+    
+    @classmethod
+    def from_row(cls, rule_id: str, condition: str, error: str,
+                 row: dict = None) -> "RuleExecutionError":
+        """Create the error from a full row, keeping only the first few columns."""
+        return cls(rule_id, condition, error, row_data=row)
+    
+    @property
+    def message(self) -> str:
+        message = f"Rule '{self.rule_id}' failed during execution: {self.error}\n"
+        message += f"Condition: {self.condition}"
+        if self.sample_row:
+            message += f"\nSample row: {self.sample_row}"
+        return message
+    
+    @property
+    def details(self) -> dict:
         details = {
-            "rule_id": rule_id,
-            "condition": condition,
-            "error": error
+            "rule_id": self.rule_id,
+            "condition": self.condition,
+            "error": self.error
         }
-        
-        if row_data:
-            # Include first few rows for debugging (but don't blow up)
-            sample = dict(list(row_data.items())[:5])
-            details["sample_row"] = sample
-            message += f"\nSample row: {sample}"
-        
-        super().__init__(message, details)
+        if self.sample_row:
+            details["sample_row"] = self.sample_row
+        return details
 
 
 # ─── SECURITY ERRORS ─────────────────────────────────────────
@@ -5,17 +5,86 @@ Sends notifications when rules fail via:
 - Slack (webhooks)
 """
 
-import smtplib
+import html
 import json
-import requests
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import threading
+from string import Template
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, NamedTuple, Tuple
 from datetime import datetime
 
 from .observability import StructuredLogger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Violation rows shown per failed rule in an email
+EMAIL_MAX_ROWS = 10
+
+
+class _AlertFailure(NamedTuple):
+    """A failed rule flattened once for every alert renderer."""
+    rule_id: str
+    rule_name: str
+    failed_rows: int
+    total_rows: int
+    pass_rate: float
+    cols: Tuple[str, ...]
+    rows: List[tuple]
+
+
+# Slack failures listed per message, keeping under its size limits
+SLACK_MAX_FAILURES = 5
+
+# Static skeleton of every Slack payload up to the first failure; the
+# placeholders take already-encoded JSON values
+_SLACK_HEAD = Template(
+    '{"blocks":['
+    '{"type":"header","text":{"type":"plain_text","text":$title,"emoji":true}},'
+    '{"type":"section","fields":['
+    '{"type":"mrkdwn","text":$scan_id},'
+    '{"type":"mrkdwn","text":$time}]},'
+    '{"type":"section","fields":['
+    '{"type":"mrkdwn","text":$total},'
+    '{"type":"mrkdwn","text":$passed},'
+    '{"type":"mrkdwn","text":$failed},'
+    '{"type":"mrkdwn","text":$errors}]},'
+    '{"type":"divider"}'
+)
+_SLACK_DIVIDER = '{"type":"divider"}'
+
+
+def _json(value) -> str:
+    """Encode one value as JSON text, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(value, default=str).decode()
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+# Alert sends allowed in flight before send_alerts blocks the caller
+MAX_PENDING_ALERTS = 16
+
+
+# Static start of every alert email, up to the opening <body>
+_EMAIL_HEAD = """
+        <html>
+        <head>
+            <style>
+                body { font-family: Arial, sans-serif; }
+                .header { background-color: #f44336; color: white; padding: 20px; }
+                .summary { margin: 20px; padding: 20px; background-color: #f5f5f5; }
+                .rule { margin: 20px; padding: 20px; border-left: 4px solid #f44336; }
+                table { border-collapse: collapse; width: 100%; }
+                th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+                th { background-color: #4CAF50; color: white; }
+            </style>
+        </head>
+        <body>
+"""
+
 
 class Notifier:
     """Send alerts when compliance checks fail."""
@@ -46,42 +115,130 @@ class Notifier:
         
         # Slack config
         self.slack_config = self.config.get('slack', {})
+        
+        # Channels are fixed once configured, so decide up front
+        self._email_on = bool(self.email_config)
+        self._slack_on = bool(self.slack_config)
+        self._enabled = self._email_on or self._slack_on
+        
+        # Keep-alive session so repeated webhook posts skip the TLS handshake
+        self._session = self._build_session() if self._slack_on else None
+        
+        # SMTP connection reused across alert batches; guarded for the pool
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
+        
+        # Sends run in the background so a scan never waits on SMTP or HTTP
+        self._pool = None
+        self._pending = threading.BoundedSemaphore(MAX_PENDING_ALERTS)
+        if self._enabled:
+            self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="notifier")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def close(self):
+        """Wait for queued alerts to be sent and release resources."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        with self._smtp_lock:
+            self._drop_smtp()
+    
+    @staticmethod
+    def _build_session():
+        # Imported here so loading the module doesn't pull in requests/urllib3
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        # Connection failures are retried; POSTs are never resent after a response
+        retry = Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+        session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry))
+        return session
+    
+    def is_configured(self) -> bool:
+        """Whether any alert channel is configured."""
+        return self._enabled
     
     def send_alerts(self, failures: List[Any], scan_id: str, summary: dict):
         """Send alerts through all configured channels."""
-        if not failures:
+        if not self._enabled or not failures:
             return
         
-        if self.email_config:
-            self._send_email(failures, scan_id, summary)
+        failures = self._normalize_failures(failures)
+        if self._email_on:
+            self._submit(self._send_email, failures, scan_id, summary)
         
-        if self.slack_config:
-            self._send_slack(failures, scan_id, summary)
+        if self._slack_on:
+            self._submit(self._send_slack, failures, scan_id, summary)
+    
+    @staticmethod
+    def _normalize_failures(failures: List[Any]) -> List[_AlertFailure]:
+        """Read each failure's columns and preview rows once for all channels."""
+        normalized = []
+        for failure in failures:
+            cols, rows = (), []
+            if failure.violations:
+                cols = tuple(failure.violations[0]['row_data'])
+                rows = [tuple(v['row_data'][c] for c in cols)
+                        for v in failure.violations[:EMAIL_MAX_ROWS]]
+            normalized.append(_AlertFailure(
+                failure.rule_id, failure.rule_name, failure.failed_rows,
+                failure.total_rows, failure.pass_rate, cols, rows
+            ))
+        return normalized
     
-    def _send_email(self, failures: List[Any], scan_id: str, summary: dict):
+    def _submit(self, send, *args):
+        if self._pool is None:
+            # Closed notifier: deliver inline rather than drop the alert
+            send(*args)
+            return
+        # Bound the queue: block once MAX_PENDING_ALERTS sends are outstanding
+        self._pending.acquire()
+        try:
+            future = self._pool.submit(send, *args)
+        except BaseException:
+            self._pending.release()
+            raise
+        future.add_done_callback(lambda _: self._pending.release())
+    
+    def _send_email(self, failures: List[_AlertFailure], scan_id: str, summary: dict):
         """Send email alert."""
+        import smtplib
+        from email.message import EmailMessage
+        from email.policy import SMTP
+        
         try:
-            # Create message
-            msg = MIMEMultipart()
+            from_addr = self.email_config.get('from_addr')
+            to_addrs = self.email_config.get('to_addrs', [])
+            
+            # Single-part HTML message; no multipart wrapper is needed
+            msg = EmailMessage(policy=SMTP)
             msg['Subject'] = f"🚨 Compliance Alert: {len(failures)} Rule(s) Failed"
-            msg['From'] = self.email_config.get('from_addr')
-            msg['To'] = ', '.join(self.email_config.get('to_addrs', []))
+            msg['From'] = from_addr
+            msg['To'] = ', '.join(to_addrs)
             
             # Build HTML body
             html = self._build_email_html(failures, scan_id, summary)
-            msg.attach(MIMEText(html, 'html'))
+            msg.set_content(html, subtype='html')
             
-            # Send email
-            with smtplib.SMTP(
-                self.email_config.get('smtp_host'),
-                self.email_config.get('smtp_port')
-            ) as server:
-                server.starttls()
-                server.login(
-                    self.email_config.get('username'),
-                    self.email_config.get('password')
-                )
-                server.send_message(msg)
+            # Send email, serialized to wire bytes exactly once
+            raw = msg.as_bytes()
+            with self._smtp_lock:
+                try:
+                    self._get_smtp().sendmail(from_addr, to_addrs, raw)
+                except (smtplib.SMTPServerDisconnected, ConnectionError):
+                    # The server dropped the idle connection; reconnect once
+                    self._drop_smtp()
+                    self._get_smtp().sendmail(from_addr, to_addrs, raw)
             
             self.logger.info("email_alerts_sent", 
                            count=len(failures),
@@ -90,16 +247,46 @@ class Notifier:
         except Exception as e:
             self.logger.error("email_alerts_failed", error=str(e))
     
-    def _send_slack(self, failures: List[Any], scan_id: str, summary: dict):
+    def _get_smtp(self):
+        """Return the live SMTP connection, connecting and logging in on first use."""
+        if self._smtp is None:
+            import smtplib
+            
+            server = smtplib.SMTP(
+                self.email_config.get('smtp_host'),
+                self.email_config.get('smtp_port')
+            )
+            try:
+                server.starttls()
+                server.login(
+                    self.email_config.get('username'),
+                    self.email_config.get('password')
+                )
+            except BaseException:
+                server.close()
+                raise
+            self._smtp = server
+        return self._smtp
+    
+    def _drop_smtp(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                self._smtp.close()
+            self._smtp = None
+    
+    def _send_slack(self, failures: List[_AlertFailure], scan_id: str, summary: dict):
         """Send Slack alert via webhook."""
         try:
-            # Build Slack message blocks
-            blocks = self._build_slack_blocks(failures, scan_id, summary)
+            # Build the Slack payload straight to JSON bytes
+            payload = self._build_slack_payload(failures, scan_id, summary)
             
-            # Send to webhook
-            response = requests.post(
+            response = self._session.post(
                 self.slack_config.get('webhook_url'),
-                json={'blocks': blocks}
+                data=payload,
+                headers={'Content-Type': 'application/json'},
+                timeout=5
             )
             response.raise_for_status()
             
@@ -108,23 +295,10 @@ class Notifier:
         except Exception as e:
             self.logger.error("slack_alerts_failed", error=str(e))
     
-    def _build_email_html(self, failures: List[Any], scan_id: str, summary: dict) -> str:
+    def _build_email_html(self, failures: List[_AlertFailure], scan_id: str, summary: dict) -> str:
         """Build HTML email body."""
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; }}
-                .header {{ background-color: #f44336; color: white; padding: 20px; }}
-                .summary {{ margin: 20px; padding: 20px; background-color: #f5f5f5; }}
-                .rule {{ margin: 20px; padding: 20px; border-left: 4px solid #f44336; }}
-                table {{ border-collapse: collapse; width: 100%; }}
-                th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                th {{ background-color: #4CAF50; color: white; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
+        # Fragments are collected and joined once; += would copy the growing body
+        parts = [_EMAIL_HEAD, f"""            <div class="header">
                 <h1>🚨 Compliance Alert: {len(failures)} Rule(s) Failed</h1>
                 <p>Scan ID: {scan_id}</p>
                 <p>Time: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
@@ -139,107 +313,82 @@ class Notifier:
             </div>
             
             <h2>Failed Rules</h2>
-        """
+        """]
         
         for failure in failures:
-            html += f"""
+            parts.append(f"""
             <div class="rule">
                 <h3>{failure.rule_id}: {failure.rule_name}</h3>
                 <p>Failed: {failure.failed_rows} of {failure.total_rows} rows</p>
                 <p>Pass Rate: {failure.pass_rate:.1f}%</p>
-            """
+            """)
             
-            if failure.violations:
-                html += "<h4>Violations:</h4><table><tr>"
-                # Add headers
-                for col in failure.violations[0]['row_data'].keys():
-                    html += f"<th>{col}</th>"
-                html += "</tr>"
+            if failure.rows:
+                parts.append("<h4>Violations:</h4><table><tr>")
+                # Add headers; data values are escaped so they can't break the markup
+                parts.extend(f"<th>{html.escape(str(col))}</th>" for col in failure.cols)
+                parts.append("</tr>")
                 
-                # Add rows (max 10)
-                for v in failure.violations[:10]:
-                    html += "<tr>"
-                    for val in v['row_data'].values():
-                        html += f"<td>{val}</td>"
-                    html += "</tr>"
+                # Add rows (max EMAIL_MAX_ROWS)
+                for row in failure.rows:
+                    parts.append("<tr>" + "".join(f"<td>{html.escape(str(val))}</td>" for val in row) + "</tr>")
                 
-                if len(failure.violations) > 10:
-                    html += f"<tr><td colspan='100%'>... and {len(failure.violations) - 10} more violations</td></tr>"
+                if failure.failed_rows > EMAIL_MAX_ROWS:
+                    parts.append(f"<tr><td colspan='100%'>... and {failure.failed_rows - EMAIL_MAX_ROWS} more violations</td></tr>")
                 
-                html += "</table>"
+                parts.append("</table>")
             
-            html += "</div>"
+            parts.append("</div>")
         
-        html += """
+        parts.append("""
         </body>
         </html>
-        """
-        return html
+        """)
+        return "".join(parts)
     
-    def _build_slack_blocks(self, failures: List[Any], scan_id: str, summary: dict) -> List[dict]:
-        """Build Slack message blocks."""
-        blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"🚨 {len(failures)} Compliance Rule(s) Failed",
-                    "emoji": True
-                }
-            },
-            {
-                "type": "section",
-                "fields": [
-                    {"type": "mrkdwn", "text": f"*Scan ID:*\n{scan_id}"},
-                    {"type": "mrkdwn", "text": f"*Time:*\n{datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}"}
-                ]
-            },
-            {
-                "type": "section",
-                "fields": [
-                    {"type": "mrkdwn", "text": f"*Total Rules:* {summary['total']}"},
-                    {"type": "mrkdwn", "text": f"*✅ Passed:* {summary['passed']}"},
-                    {"type": "mrkdwn", "text": f"*❌ Failed:* {summary['failed']}"},
-                    {"type": "mrkdwn", "text": f"*⚠️ Errors:* {summary['errors']}"}
-                ]
-            },
-            {"type": "divider"}
-        ]
+    def _build_slack_payload(self, failures: List[_AlertFailure], scan_id: str, summary: dict) -> bytes:
+        """Build the Slack webhook body as JSON bytes."""
+        # The static blocks come from a template; only the small per-failure
+        # blocks are serialized as dicts
+        parts = [_SLACK_HEAD.substitute(
+            title=_json(f"🚨 {len(failures)} Compliance Rule(s) Failed"),
+            scan_id=_json(f"*Scan ID:*\n{scan_id}"),
+            time=_json(f"*Time:*\n{datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}"),
+            total=_json(f"*Total Rules:* {summary['total']}"),
+            passed=_json(f"*✅ Passed:* {summary['passed']}"),
+            failed=_json(f"*❌ Failed:* {summary['failed']}"),
+            errors=_json(f"*⚠️ Errors:* {summary['errors']}")
+        )]
         
         # Add failed rules
-        for failure in failures[:5]:  # Limit to 5 failures to avoid Slack message size limits
-            blocks.append({
+        for failure in failures[:SLACK_MAX_FAILURES]:
+            parts.append(_json({
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
                     "text": f"*{failure.rule_id}: {failure.rule_name}*\nFailed: {failure.failed_rows} of {failure.total_rows} rows (Pass rate: {failure.pass_rate:.1f}%)"
                 }
-            })
+            }))
             
-            if failure.violations:
+            if failure.rows:
                 # Show first violation as example
-                v = failure.violations[0]
-                example = ", ".join([f"{k}={v['row_data'][k]}" for k in list(v['row_data'].keys())[:3]])
-                blocks.append({
+                example = ", ".join([f"{k}={v}" for k, v in zip(failure.cols[:3], failure.rows[0])])
+                parts.append(_json({
                     "type": "context",
                     "elements": [
                         {"type": "mrkdwn", "text": f"Example violation: {example}..."}
                     ]
-                })
+                }))
             
-            blocks.append({"type": "divider"})
+            parts.append(_SLACK_DIVIDER)
         
-        if len(failures) > 5:
-            blocks.append({
+        if len(failures) > SLACK_MAX_FAILURES:
+            parts.append(_json({
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": f"... and {len(failures) - 5} more failures"
+                    "text": f"... and {len(failures) - SLACK_MAX_FAILURES} more failures"
                 }
-            })
+            }))
         
-        return blocks
-    
-    def is_configured(self) -> bool:
-        """Check if at least one notification method is configured."""
-        return bool(self.email_config) or bool(self.slack_config)
+        return (",".join(parts) + "]}").encode("utf-8")
@@ -1,11 +1,84 @@
 """Error tracking and categorization."""
 
+import atexit
+import logging
+import sys
+import time
 import traceback
-from datetime import datetime
+import weakref
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Buffered error lines are written once this many pile up or the oldest
+# has waited this long; anything left is flushed at interpreter exit
+FLUSH_LINES = 64
+FLUSH_SECONDS = 5.0
+
+
+_SEV_TO_LEVEL = {
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+}
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """Console handler that follows sys.stdout even if it is swapped later."""
+    
+    @property
+    def stream(self):
+        return sys.stdout
+    
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+# User-facing error lines go through logging so filtered severities are
+# never formatted. As a library this module leaves handlers to the
+# application; the CLI prints them through enable_console_errors()
+_log = logging.getLogger(__name__)
+
+
+def enable_console_errors():
+    """Print tracked error lines plainly to stdout, as the CLI does."""
+    if not any(isinstance(handler, _StdoutHandler) for handler in _log.handlers):
+        console = _StdoutHandler()
+        console.setFormatter(logging.Formatter("%(message)s"))
+        _log.addHandler(console)
+    _log.setLevel(logging.INFO)
+
+
+# Live trackers, flushed and closed at exit; held weakly so discarded ones
+# are still collected (and close themselves)
+_trackers = weakref.WeakSet()
+
+
+def _close_all():
+    for tracker in list(_trackers):
+        tracker.close()
+
+
+atexit.register(_close_all)
+
+
+def _dumps_line(entry: Dict) -> bytes:
+    """Serialize one JSONL record, newline included, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(entry, default=str,
+                            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(entry) + "\n").encode("utf-8")
+
 
 class ErrorCategory:
     """Error categories for classification."""
@@ -32,10 +105,21 @@ class ErrorCategory:
 class ErrorTracker:
     """Track and categorize errors."""
     
-    def __init__(self, error_dir: str = "errors"):
+    def __init__(self, error_dir: str = "errors", max_in_memory: int = 1000):
         self.error_dir = Path(error_dir)
         self.error_dir.mkdir(parents=True, exist_ok=True)
-        self.errors = []
+        # Only the newest entries are kept in memory; the daily file has them all
+        self.errors = deque(maxlen=max_in_memory)
+        # Per-category counts of the entries currently in self.errors
+        self._counts = Counter()
+        
+        # Today's JSONL file stays open; lines are batched into _buf
+        self._fh = None
+        self._fh_date = None
+        self._rollover_at = 0.0
+        self._buf = []
+        self._buf_since = 0.0
+        _trackers.add(self)
     
     def track(self,
               error: Exception,
@@ -44,7 +128,12 @@ class ErrorTracker:
               user_message: Optional[str] = None,
               severity: str = "ERROR"):
         """Track an error."""
-        stack_trace = traceback.format_exc()
+        # Only format a trace when one exists and the entry is serious enough
+        # to need it; otherwise store "" so every record has the same keys
+        if severity in ("ERROR", "CRITICAL") and sys.exc_info()[0] is not None:
+            stack_trace = traceback.format_exc()
+        else:
+            stack_trace = ""
         
         if user_message is None:
             user_message = self._generate_user_message(error, category)
@@ -60,12 +149,25 @@ class ErrorTracker:
             "context": context or {}
         }
         
-        self.errors.append(error_entry)
-        self._save_error(error_entry)
+        if self.errors and len(self.errors) == self.errors.maxlen:
+            # The oldest entry is about to be evicted; drop it from the counts
+            evicted = self.errors[0]["category"]
+            self._counts[evicted] -= 1
+            if not self._counts[evicted]:
+                del self._counts[evicted]
+        # max_in_memory=0 keeps nothing in memory; the daily file still has it
+        if self.errors.maxlen != 0:
+            self.errors.append(error_entry)
+            self._counts[category] += 1
+        # Serialize once; the bytes are shared by every sink that wants JSON
+        blob = _dumps_line(error_entry)
+        self._save_error(error_entry, blob)
         
         # Also print to console with nice formatting
-        icon = "🔴" if severity == "ERROR" else "🟡" if severity == "WARNING" else "⚪"
-        print(f"{icon} Error: {user_message}")
+        level = _SEV_TO_LEVEL.get(severity, logging.ERROR)
+        if _log.isEnabledFor(level):
+            icon = "🔴" if severity == "ERROR" else "🟡" if severity == "WARNING" else "⚪"
+            _log.log(level, "%s Error: %s", icon, user_message)
     
     def _generate_user_message(self, error: Exception, category: str) -> str:
         """Generate user-friendly error message."""
@@ -81,26 +183,62 @@ class ErrorTracker:
         }
         return messages.get(category, f"Error: {error}")
     
-    def _save_error(self, error_entry: Dict):
-        """Save error to file."""
-        date_str = datetime.utcnow().strftime('%Y%m%d')
-        error_file = self.error_dir / f"errors_{date_str}.jsonl"
+    def _save_error(self, error_entry: Dict, blob: Optional[bytes] = None):
+        """Queue error for the daily file, writing in batches."""
+        if blob is None:
+            blob = _dumps_line(error_entry)
+        # One float compare per error; the date is only formatted at rollover
+        if self._fh is None or time.time() >= self._rollover_at:
+            self._open_daily_file()
         
-        with open(error_file, 'a') as f:
-            f.write(json.dumps(error_entry) + "\n")
+        if not self._buf:
+            self._buf_since = time.monotonic()
+        self._buf.append(blob)
+        if len(self._buf) >= FLUSH_LINES or time.monotonic() - self._buf_since >= FLUSH_SECONDS:
+            self.flush()
+    
+    def _open_daily_file(self):
+        """Switch to today's error file, finishing the previous one."""
+        self.close()
+        now = datetime.utcnow()
+        date_str = now.strftime('%Y%m%d')
+        # Recreate the directory in case it was removed while we were running
+        self.error_dir.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.error_dir / f"errors_{date_str}.jsonl", 'ab')
+        self._fh_date = date_str
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        self._rollover_at = midnight.replace(tzinfo=timezone.utc).timestamp()
+    
+    def flush(self):
+        """Write buffered error lines to disk."""
+        if self._buf and self._fh is not None:
+            self._fh.writelines(self._buf)
+            self._fh.flush()
+        self._buf.clear()
+    
+    def close(self):
+        """Flush and close the error file."""
+        self.flush()
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            self._fh_date = None
+            self._rollover_at = 0.0
+    
+    def __del__(self):
+        # A discarded tracker writes out what is still buffered
+        if hasattr(self, "_fh"):
+            self.close()
     
     def get_recent(self, limit: int = 10) -> List[Dict]:
         """Get most recent errors."""
-        return self.errors[-limit:]
+        return list(self.errors)[-limit:]
     
     def summary(self) -> Dict[str, int]:
         """Get error summary by category."""
-        summary = {}
-        for error in self.errors:
-            cat = error["category"]
-            summary[cat] = summary.get(cat, 0) + 1
-        return summary
+        return dict(self._counts)
     
     def clear(self):
         """Clear in-memory errors."""
-        self.errors = []
+        self.errors.clear()
+        self._counts.clear()
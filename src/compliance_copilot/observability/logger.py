@@ -1,13 +1,130 @@
 """Structured logging for Compliance Copilot."""
 
+import atexit
 import json
 import logging
+import queue
 import sys
+import threading
+import time
+import weakref
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
 from logging.handlers import RotatingFileHandler
 
+from ..utils import get_env_int
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Buffered JSON lines are written once this many bytes pile up or the
+# oldest has waited this long; ERROR entries are written immediately.
+# Tunable via LOG_BUFFER_BYTES (default 64 KiB) and LOG_FLUSH_INTERVAL_MS
+# (default 30000, the usual buffered-log-file interval)
+FLUSH_BYTES = max(0, get_env_int("LOG_BUFFER_BYTES", 64 * 1024))
+FLUSH_SECONDS = max(1, get_env_int("LOG_FLUSH_INTERVAL_MS", 30_000)) / 1000
+
+def _console_prefix(level: str) -> str:
+    # Color coding for different levels
+    icon = {"ERROR": "🔴", "WARNING": "🟡", "INFO": "🔵"}.get(level, "⚪")
+    return f"{icon} [{level:8}] "
+
+
+_LEVEL_NAMES = {
+    logging.DEBUG: "DEBUG",
+    logging.INFO: "INFO",
+    logging.WARNING: "WARNING",
+    logging.ERROR: "ERROR",
+}
+_CONSOLE_PREFIX = {name: _console_prefix(name) for name in _LEVEL_NAMES.values()}
+_CONSOLE_SKIP = frozenset(("timestamp", "logger", "level", "event"))
+
+# (second, "YYYY-MM-DDTHH:MM:SS") of the last timestamp formatted
+_ts_cache = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time in ISO 8601 with microseconds, formatting the
+    date/time part at most once per second."""
+    global _ts_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}"
+
+
+# Entries queued per drain pass of the writer thread
+DRAIN_BATCH = 256
+
+# File output happens on one daemon writer thread shared by every logger:
+# callers only enqueue (logger, entry, done) and the writer encodes, buffers
+# and flushes, also flushing idle buffers every FLUSH_SECONDS. Loggers are
+# held weakly so discarded ones are still collected (and flush themselves)
+_file_loggers = weakref.WeakSet()
+_queue = queue.SimpleQueue()
+_writer = None
+_writer_stopped = False
+_writer_lock = threading.Lock()
+
+
+def _flush_all():
+    for logger in list(_file_loggers):
+        logger.flush()
+
+
+def _drain():
+    while True:
+        try:
+            batch = [_queue.get(timeout=FLUSH_SECONDS)]
+        except queue.Empty:
+            _flush_all()
+            continue
+        while len(batch) < DRAIN_BATCH:
+            try:
+                batch.append(_queue.get_nowait())
+            except queue.Empty:
+                break
+        for item in batch:
+            if item is None:
+                return
+            logger, entry, done = item
+            logger._write_json_file(entry)
+            if done is not None:
+                done.set()
+        # Don't keep the last logger alive while waiting for the next batch
+        batch = item = logger = entry = done = None
+
+
+def _stop_writer():
+    global _writer, _writer_stopped
+    with _writer_lock:
+        writer, _writer = _writer, None
+        _writer_stopped = True
+    if writer is not None:
+        _queue.put(None)
+        writer.join(timeout=10)
+    _flush_all()
+
+
+def _register(logger: "StructuredLogger"):
+    global _writer
+    with _writer_lock:
+        _file_loggers.add(logger)
+        if _writer is None and not _writer_stopped:
+            _writer = threading.Thread(target=_drain, name="log-writer", daemon=True)
+            _writer.start()
+            atexit.register(_stop_writer)
+
+
+def _disabled(event: str, **kwargs):
+    """Stand-in for a log method whose level is filtered out."""
+
 
 class StructuredLogger:
     """Logger that outputs structured JSON logs."""
@@ -24,6 +141,13 @@ class StructuredLogger:
         self.level = getattr(logging, level.upper(), logging.INFO)
         self.console_enabled = console
         
+        # Methods for filtered levels become no-ops, so those calls skip
+        # even the kwargs handling in _log
+        for method, method_level in (("debug", logging.DEBUG), ("info", logging.INFO),
+                                     ("warning", logging.WARNING), ("error", logging.ERROR)):
+            if method_level < self.level:
+                setattr(self, method, _disabled)
+        
         # Create log directory
         if json_file:
             self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -34,6 +158,13 @@ class StructuredLogger:
             )
         else:
             self.file_handler = None
+        
+        # Encoded lines wait here instead of costing a write+flush each
+        self._buf = bytearray()
+        self._buf_since = 0.0
+        self._buf_lock = threading.Lock()
+        if self.file_handler:
+            _register(self)
     
     def debug(self, event: str, **kwargs):
         """Log a debug event."""
@@ -57,9 +188,9 @@ class StructuredLogger:
             return
         
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _utc_timestamp() + "Z",
             "logger": self.name,
-            "level": logging.getLevelName(level),
+            "level": _LEVEL_NAMES[level],
             "event": event,
             **data
         }
@@ -68,37 +199,73 @@ class StructuredLogger:
             self._write_console(log_entry)
         
         if self.file_handler:
-            self._write_json_file(log_entry)
+            if _writer is None:
+                # Writer already stopped (interpreter exit): write inline
+                self._write_json_file(log_entry)
+            elif level >= logging.ERROR:
+                # Errors are on disk before the call returns, as before
+                done = threading.Event()
+                _queue.put((self, log_entry, done))
+                done.wait(timeout=5)
+            else:
+                _queue.put((self, log_entry, None))
     
     def _write_console(self, entry: Dict[str, Any]):
         """Write human-readable log to console."""
-        level = entry["level"]
-        event = entry["event"]
-        timestamp = entry["timestamp"][11:19]
-        
-        # Color coding for different levels
-        if level == "ERROR":
-            prefix = "🔴"
-        elif level == "WARNING":
-            prefix = "🟡"
-        elif level == "INFO":
-            prefix = "🔵"
-        else:
-            prefix = "⚪"
-        
-        console_msg = f"{prefix} [{level:8}] {timestamp} - {event}"
-        
-        skip_fields = {"timestamp", "logger", "level", "event"}
+        # "🔴 [ERROR   ] " etc. are built once per level, not per line
+        parts = [_CONSOLE_PREFIX.get(entry["level"]) or _console_prefix(entry["level"]),
+                 entry["timestamp"][11:19], " - ", str(entry["event"])]
         for key, value in entry.items():
-            if key not in skip_fields:
-                console_msg += f" - {key}={value}"
+            if key not in _CONSOLE_SKIP:
+                parts.append(f" - {key}={value}")
+        parts.append("\n")
         
-        print(console_msg)
+        sys.stdout.write("".join(parts))
     
     def _write_json_file(self, entry: Dict[str, Any]):
         """Write JSON log to file."""
         try:
-            self.file_handler.stream.write(json.dumps(entry) + "\n")
-            self.file_handler.flush()
+            if orjson is not None:
+                line = orjson.dumps(entry, default=str, option=orjson.OPT_APPEND_NEWLINE)
+            else:
+                line = (json.dumps(entry) + "\n").encode("utf-8")
         except Exception:
             print(f"Failed to write log: {entry}", file=sys.stderr)
+            return
+        
+        with self._buf_lock:
+            if not self._buf:
+                self._buf_since = time.monotonic()
+            self._buf += line
+            if (entry["level"] == "ERROR" or len(self._buf) >= FLUSH_BYTES
+                    or time.monotonic() - self._buf_since >= FLUSH_SECONDS):
+                self._flush_locked()
+    
+    def flush(self):
+        """Write buffered JSON log lines to the file."""
+        with self._buf_lock:
+            self._flush_locked()
+    
+    def __del__(self):
+        # Queued entries hold a reference, so by now they are all buffered
+        if getattr(self, "_buf_lock", None) is not None and self.file_handler:
+            self.flush()
+            self.file_handler.close()
+    
+    def _flush_locked(self):
+        if not self._buf or not self.file_handler:
+            return
+        try:
+            # The handler's text stream has nothing pending; write bytes below it
+            handler = self.file_handler
+            raw = handler.stream.buffer
+            # Rotate here since lines never pass through the handler's emit()
+            size = raw.tell()
+            if handler.maxBytes and size and size + len(self._buf) > handler.maxBytes:
+                handler.doRollover()
+                raw = handler.stream.buffer
+            raw.write(self._buf)
+            raw.flush()
+        except Exception:
+            print(f"Failed to write {len(self._buf)} bytes of logs", file=sys.stderr)
+        self._buf.clear()
@@ -1,12 +1,91 @@
 """Simple metrics collection for Compliance Copilot."""
 
 import time
-from typing import Dict, Any, Optional
-from collections import Counter
+from bisect import bisect_right
+from typing import Dict, Any, Iterable, Optional, Tuple
+from collections import Counter, deque
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
 
+from ..utils import get_env_int
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Recent timer samples kept verbatim; totals are tracked per key instead
+RECENT_TIMERS = 1000
+
+# Formatted metric keys remembered per (name, tags)
+KEY_CACHE_SIZE = 4096
+
+# Distinct pending counter/gauge keys held before merging into the totals;
+# tunable via METRICS_PENDING_MAX_KEYS
+PENDING_MAX_KEYS = max(1, get_env_int("METRICS_PENDING_MAX_KEYS", 1024))
+
+
+def _tags_key(tags: Optional[Dict]):
+    """Hashable, order-independent form of a tag dict."""
+    return frozenset(tags.items()) if tags else None
+
+
+class _QuantileSketch:
+    """Greenwald-Khanna streaming quantile summary.
+    
+    Answers quantile queries with rank error at most ``epsilon * n`` while
+    keeping O(1/epsilon * log(epsilon * n)) samples instead of all of them.
+    """
+    
+    def __init__(self, epsilon: float = 0.01):
+        self.epsilon = epsilon
+        self.n = 0
+        # Parallel lists: sorted sample values and their [g, delta] pairs
+        self._values = []
+        self._tuples = []
+        self._period = max(1, int(1 / (2 * epsilon)))
+    
+    def insert(self, value: float):
+        """Add one observation."""
+        values = self._values
+        i = bisect_right(values, value)
+        delta = 0 if i == 0 or i == len(values) else int(2 * self.epsilon * self.n)
+        values.insert(i, value)
+        self._tuples.insert(i, [1, delta])
+        self.n += 1
+        if self.n % self._period == 0:
+            self._compress()
+    
+    def _compress(self):
+        threshold = int(2 * self.epsilon * self.n)
+        values, tuples = self._values, self._tuples
+        # Merge right-to-left; the first and last samples (min/max) are kept
+        i = len(values) - 2
+        while i >= 1:
+            g, _ = tuples[i]
+            g_next, delta_next = tuples[i + 1]
+            if g + g_next + delta_next <= threshold:
+                tuples[i + 1][0] += g
+                del values[i]
+                del tuples[i]
+            i -= 1
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Value at quantile q, using the same 0-based rank as sorted(values)[int(n * q)]."""
+        if not self.n:
+            return None
+        rank = min(int(self.n * q), self.n - 1) + 1
+        best, best_err = self._values[0], None
+        r_min = 0
+        for value, (g, delta) in zip(self._values, self._tuples):
+            r_min += g
+            err = max(rank - r_min, r_min + delta - rank)
+            if best_err is None or err < best_err:
+                best, best_err = value, err
+        return best
+
 
 class MetricsCollector:
     """Collect and report metrics."""
@@ -18,19 +97,55 @@ class MetricsCollector:
         
         self.counters = Counter()
         self.gauges = {}
-        self.timers = []
+        self.timers = deque(maxlen=RECENT_TIMERS)
+        # Per timer key: [count, min, max, total] plus a p95 sketch
+        self._timer_stats = {}
+        self._sketches = {}
+        # Updates are aggregated by (name, tags) and only turned into
+        # "name[k=v,...]" keys when the totals are read
+        self._pending_counts = {}
+        self._pending_gauges = {}
+        self._key_cache = {}
         self.session_start = datetime.utcnow()
         self.last_snapshot = datetime.utcnow()
     
     def increment(self, name: str, value: int = 1, tags: Optional[Dict] = None):
         """Increment a counter."""
-        key = self._format_key(name, tags)
-        self.counters[key] += value
+        key = (name, _tags_key(tags))
+        pending = self._pending_counts
+        pending[key] = pending.get(key, 0) + value
+        if len(pending) > PENDING_MAX_KEYS:
+            self._flush_pending()
+    
+    def bulk_increment(self, items: Iterable[Tuple[str, Optional[Dict], int]]):
+        """Increment several counters at once from (name, tags, value) tuples."""
+        pending = self._pending_counts
+        for name, tags, value in items:
+            key = (name, _tags_key(tags))
+            pending[key] = pending.get(key, 0) + value
+        if len(pending) > PENDING_MAX_KEYS:
+            self._flush_pending()
     
     def gauge(self, name: str, value: float, tags: Optional[Dict] = None):
         """Set a gauge value."""
-        key = self._format_key(name, tags)
-        self.gauges[key] = value
+        pending = self._pending_gauges
+        pending[(name, _tags_key(tags))] = value
+        if len(pending) > PENDING_MAX_KEYS:
+            self._flush_pending()
+    
+    def _flush_pending(self):
+        """Merge aggregated counter and gauge updates into the totals."""
+        cached_key = self._cached_key
+        if self._pending_counts:
+            counters = self.counters
+            for (name, tags), value in self._pending_counts.items():
+                counters[cached_key(name, tags)] += value
+            self._pending_counts.clear()
+        if self._pending_gauges:
+            gauges = self.gauges
+            for (name, tags), value in self._pending_gauges.items():
+                gauges[cached_key(name, tags)] = value
+            self._pending_gauges.clear()
     
     def timer(self, name: str, tags: Optional[Dict] = None):
         """Context manager for timing operations."""
@@ -38,13 +153,42 @@ class MetricsCollector:
     
     def record_timer(self, name: str, duration_ms: float, tags: Optional[Dict] = None):
         """Record a timer value manually."""
-        key = self._format_key(name, tags)
+        self._record_timer_ns(name, int(duration_ms * 1_000_000), tags)
+    
+    def _record_timer_ns(self, name: str, duration_ns: int, tags: Optional[Dict] = None):
+        # Timer stats and sketches are kept in integer nanoseconds and only
+        # converted to milliseconds when reported
+        key = self._cached_key(name, _tags_key(tags))
+        stats = self._timer_stats.get(key)
+        if stats is None:
+            self._timer_stats[key] = [1, duration_ns, duration_ns, duration_ns]
+            sketch = self._sketches[key] = _QuantileSketch()
+        else:
+            stats[0] += 1
+            if duration_ns < stats[1]:
+                stats[1] = duration_ns
+            if duration_ns > stats[2]:
+                stats[2] = duration_ns
+            stats[3] += duration_ns
+            sketch = self._sketches[key]
+        sketch.insert(duration_ns)
         self.timers.append({
             "name": key,
-            "duration_ms": duration_ms,
+            "duration_ms": duration_ns / 1_000_000,
             "timestamp": datetime.utcnow().isoformat()
         })
     
+    def _cached_key(self, name: str, tags_key) -> str:
+        """Formatted key for a name and _tags_key() result, memoized."""
+        cache_key = (name, tags_key)
+        key = self._key_cache.get(cache_key)
+        if key is None:
+            if len(self._key_cache) >= KEY_CACHE_SIZE:
+                # Evict the oldest entry; dicts keep insertion order
+                del self._key_cache[next(iter(self._key_cache))]
+            key = self._key_cache[cache_key] = self._format_key(name, tags_key and dict(tags_key))
+        return key
+    
     def _format_key(self, name: str, tags: Optional[Dict] = None) -> str:
         """Format metric key with tags."""
         if not tags:
@@ -55,6 +199,7 @@ class MetricsCollector:
     
     def summary(self) -> Dict[str, Any]:
         """Get current metrics summary."""
+        self._flush_pending()
         return {
             "timestamp": datetime.utcnow().isoformat(),
             "uptime_seconds": (datetime.utcnow() - self.session_start).total_seconds(),
@@ -65,27 +210,16 @@ class MetricsCollector:
     
     def _summarize_timers(self) -> Dict[str, Any]:
         """Calculate statistics for timers."""
-        if not self.timers:
-            return {}
-        
-        # Group by name
-        by_name = {}
-        for timer in self.timers:
-            name = timer["name"]
-            if name not in by_name:
-                by_name[name] = []
-            by_name[name].append(timer["duration_ms"])
-        
-        # Calculate stats
         summary = {}
-        for name, values in by_name.items():
+        for name, (count, min_ns, max_ns, total_ns) in self._timer_stats.items():
+            p95_ns = self._sketches[name].quantile(0.95) if count > 20 else None
             summary[name] = {
-                "count": len(values),
-                "min_ms": min(values),
-                "max_ms": max(values),
-                "avg_ms": sum(values) / len(values),
-                "total_ms": sum(values),
-                "p95_ms": sorted(values)[int(len(values) * 0.95)] if len(values) > 20 else None
+                "count": count,
+                "min_ms": min_ns / 1_000_000,
+                "max_ms": max_ns / 1_000_000,
+                "avg_ms": total_ns / count / 1_000_000,
+                "total_ms": total_ns / 1_000_000,
+                "p95_ms": p95_ns / 1_000_000 if p95_ns is not None else None
             }
         
         return summary
@@ -98,8 +232,14 @@ class MetricsCollector:
         
         filepath = self.metrics_dir / filename
         
-        with open(filepath, 'w') as f:
-            json.dump(self.summary(), f, indent=2)
+        summary = self.summary()
+        if orjson is not None:
+            data = orjson.dumps(summary, default=str,
+                                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            data = json.dumps(summary, indent=2).encode("utf-8")
+        with open(filepath, 'wb') as f:
+            f.write(data)
         
         self.last_snapshot = datetime.utcnow()
         return filepath
@@ -115,10 +255,10 @@ class _TimerContext:
         self.start_time = None
     
     def __enter__(self):
-        self.start_time = time.perf_counter()
+        self.start_time = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.start_time is not None:
-            duration = (time.perf_counter() - self.start_time) * 1000
-            self.collector.record_timer(self.name, duration, self.tags)
+            duration_ns = time.perf_counter_ns() - self.start_time
+            self.collector._record_timer_ns(self.name, duration_ns, self.tags)
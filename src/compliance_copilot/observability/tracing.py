@@ -1,14 +1,20 @@
 """Simple request tracing for Compliance Copilot."""
 
-import uuid
+import os
+import sys
 import time
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 
+from .logger import _utc_timestamp
 
-@dataclass
+# Spans are slotted where dataclass() supports it, as in engine.models
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Span:
     """A single operation within a trace."""
     name: str
@@ -16,7 +22,8 @@ class Span:
     end_time: Optional[float] = None
     attributes: Dict[str, Any] = field(default_factory=dict)
     events: List[Dict[str, Any]] = field(default_factory=list)
-    parent_id: Optional[str] = None
+    parent_id: Optional[int] = None
+    span_id: int = 0
 
 
 class Tracer:
@@ -30,7 +37,8 @@ class Tracer:
     @contextmanager
     def trace(self, name: str, attributes: Optional[Dict] = None):
         """Create a new trace."""
-        trace_id = str(uuid.uuid4())[:8]
+        # 8 hex chars, same shape as the old uuid4 prefix without building a UUID
+        trace_id = os.urandom(4).hex()
         
         root_span = Span(
             name=name,
@@ -43,7 +51,9 @@ class Tracer:
             "trace_id": trace_id,
             "root_span": root_span,
             "current_span": root_span,
-            "start_time": datetime.utcnow()
+            "start_time": datetime.utcnow(),
+            # Spans are numbered 0 (root), 1, 2, ... in creation order
+            "next_span_id": 1
         }
         self.spans = [root_span]
         
@@ -62,11 +72,14 @@ class Tracer:
             return
         
         parent = self.current_trace["current_span"]
+        span_id = self.current_trace["next_span_id"]
+        self.current_trace["next_span_id"] = span_id + 1
         span = Span(
             name=name,
             start_time=time.time(),
             attributes=attributes or {},
-            parent_id=id(parent)
+            parent_id=parent.span_id,
+            span_id=span_id
         )
         
         old_span = self.current_trace["current_span"]
@@ -86,7 +99,7 @@ class Tracer:
         span = self.current_trace["current_span"]
         span.events.append({
             "name": name,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "attributes": attributes
         })
     
@@ -110,9 +123,11 @@ class Tracer:
         print(f"   Duration: {duration:.2f}ms")
         print(f"   Spans: {len(self.spans)}")
         
-        # Print span tree
-        for i, span in enumerate(self.spans):
-            indent = "  " * (1 if span.parent_id else 0)
+        # Print span tree; parents always precede their children
+        depth = {}
+        for span in self.spans:
+            depth[span.span_id] = 0 if span.parent_id is None else depth.get(span.parent_id, 0) + 1
+            indent = "  " * depth[span.span_id]
             span_duration = (span.end_time - span.start_time) * 1000
             attrs = f" {span.attributes}" if span.attributes else ""
             print(f"{indent}• {span.name} ({span_duration:.2f}ms){attrs}")
@@ -122,6 +137,8 @@ class Tracer:
 
 
 class _TraceContext:
+    __slots__ = ("tracer",)
+    
     def __init__(self, tracer: Tracer):
         self.tracer = tracer
     
@@ -136,6 +153,8 @@ class _TraceContext:
 
 
 class _SpanContext:
+    __slots__ = ("tracer", "span")
+    
     def __init__(self, tracer: Tracer, span: Span):
         self.tracer = tracer
         self.span = span
@@ -6,12 +6,25 @@ from pathlib import Path
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
-from .engine import RuleEngine, RuleStatus
+from .engine import DataCache, RuleEngine, RuleStatus
 from .config import ConfigLoader
 from .observability import StructuredLogger, MetricsCollector
 from .output.html_reporter import HtmlReporter
 from .notifier import Notifier
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    import json
+    return json.dumps(obj, separators=(',', ':')).encode("utf-8")
+
 
 class ScanScheduler:
     """Runs compliance scans on a schedule."""
@@ -26,9 +39,22 @@ class ScanScheduler:
         # Load config
         self.config_loader = ConfigLoader()
         self.config = self.config_loader.load(config_path)
+        # Plain-dict view shared by every scan; rebuilt only by reload_config()
+        self._config_dict = self.config.model_dump()
+        # Frames of unchanged files are reused from one scan to the next
+        self.data_cache = self._build_data_cache()
         
         # Initialize notifier
-        self.notifier = Notifier(self.config.dict().get('alerts', {}))
+        self.notifier = Notifier(self._config_dict.get('alerts', {}))
+    
+    def reload_config(self):
+        """Re-read the config file; takes effect from the next scan."""
+        self.config = self.config_loader.load(self.config_path)
+        self._config_dict = self.config.model_dump()
+        self.data_cache = self._build_data_cache()
+    
+    def _build_data_cache(self) -> DataCache:
+        return DataCache(self._config_dict.get('engine', {}).get('data_cache_mb', 0))
     
     def add_daily_scan(self, rules_dir, data_dir, output_dir, hour=9, minute=0):
         """Add a daily scan at specified time."""
@@ -74,7 +100,7 @@ class ScanScheduler:
         
         try:
             # Initialize engine
-            engine = RuleEngine(self.config.dict())
+            engine = RuleEngine(self._config_dict, data_cache=self.data_cache)
             
             # Run the scan
             results = engine.run(rules_dir, data_dir)
@@ -120,22 +146,22 @@ class ScanScheduler:
     
     def _save_json(self, results, path):
         """Save results as JSON."""
-        import json
-        data = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "results": [
-                {
+        # Written one record per line so no full document is built in memory;
+        # the file is still a single JSON object
+        with open(path, 'wb') as f:
+            f.write(b'{"timestamp":' + _dumps(datetime.utcnow().isoformat()) + b',"results":[\n')
+            for i, r in enumerate(results):
+                if i:
+                    f.write(b",\n")
+                f.write(_dumps({
                     "rule_id": r.rule_id,
                     "rule_name": r.rule_name,
                     "status": r.status.value,
                     "pass_rate": r.pass_rate,
-                    "violations": len(r.violations)
-                }
-                for r in results
-            ]
-        }
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=2)
+                    # violations holds at most max_violations sample rows
+                    "violations": r.failed_rows
+                }))
+            f.write(b"\n]}\n")
     
     def start(self):
         """Start the scheduler."""
@@ -149,6 +175,7 @@ class ScanScheduler:
     def stop(self):
         """Stop the scheduler."""
         self.scheduler.shutdown()
+        self.notifier.close()
         self.logger.info("scheduler_stopped")
     
     def list_jobs(self):
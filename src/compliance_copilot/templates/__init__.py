@@ -0,0 +1 @@
+"""Project templates shipped with the package for ``compliance-copilot init``."""
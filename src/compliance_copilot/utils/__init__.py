@@ -3,8 +3,13 @@
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import json
-import yaml
 import os
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def ensure_directory(path: str) -> Path:
@@ -14,13 +19,33 @@ def ensure_directory(path: str) -> Path:
     return directory
 
 
+def _read_bytes(path: str) -> bytes:
+    """Read a whole file with raw os calls, skipping the text-IO stack."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            # Read until EOF; the size is only a hint (files can grow or be short-read)
+            chunk = os.read(fd, max(size, 65536))
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
 def read_file_safe(path: str) -> Optional[str]:
     """Safely read a file, return None if it doesn't exist."""
     try:
-        with open(path, 'r') as f:
-            return f.read()
-    except:
+        text = _read_bytes(path).decode("utf-8")
+    except (OSError, UnicodeDecodeError):
         return None
+    # Match text-mode open(): universal newlines
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 def write_file_safe(path: str, content: str) -> bool:
@@ -37,14 +62,25 @@ def write_file_safe(path: str, content: str) -> bool:
 def load_json_safe(path: str) -> Optional[Dict]:
     """Safely load JSON file."""
     try:
-        with open(path, 'r') as f:
-            return json.load(f)
-    except:
+        data = _read_bytes(path)
+    except OSError:
+        return None
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Fall through: stdlib json also accepts NaN/Infinity literals
+            pass
+    try:
+        return json.loads(data)
+    except ValueError:
         return None
 
 
 def load_yaml_safe(path: str) -> Optional[Dict]:
     """Safely load YAML file."""
+    import yaml
+    
     try:
         with open(path, 'r') as f:
             return yaml.safe_load(f)
@@ -52,27 +88,62 @@ def load_yaml_safe(path: str) -> Optional[Dict]:
         return None
 
 
+# (directory, extension) -> (directory mtime_ns, files) from the last scan
+_dir_cache: Dict[tuple, tuple] = {}
+
+
 def list_files(directory: str, extension: Optional[str] = None) -> List[Path]:
     """List files in directory, optionally filtered by extension."""
-    path = Path(directory)
-    if not path.exists():
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    
+    # Adding, removing or renaming an entry bumps the directory's mtime,
+    # so an unchanged mtime means the previous scan is still accurate
+    key = (directory, extension)
+    cached = _dir_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return list(cached[1])
+    
+    # scandir hands back file-type info from the directory read itself,
+    # so there's no extra stat() per entry
+    try:
+        with os.scandir(directory) as entries:
+            files = [
+                Path(entry.path)
+                for entry in entries
+                if (extension is None or entry.name.endswith(extension)) and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    if extension:
-        return list(path.glob(f"*{extension}"))
-    return list(path.iterdir())
+    
+    # A change within the filesystem's timestamp granularity could leave the
+    # mtime unchanged, so only remember scans of directories that have settled
+    if time.time_ns() - mtime_ns > 2_000_000_000:
+        _dir_cache[key] = (mtime_ns, files)
+    return list(files)
+
+
+_TRUE_VALUES = frozenset(('true', 'yes', 'on', '1'))
 
 
 def get_env_bool(key: str, default: bool = False) -> bool:
     """Get boolean from environment variable."""
-    value = os.environ.get(key, str(default)).lower()
-    return value in ('true', 'yes', 'on', '1')
+    value = os.environ.get(key)
+    if value is None:
+        return default
+    return value.lower() in _TRUE_VALUES
 
 
 def get_env_int(key: str, default: int = 0) -> int:
     """Get integer from environment variable."""
+    value = os.environ.get(key)
+    if value is None:
+        return default
     try:
-        return int(os.environ.get(key, str(default)))
-    except:
+        return int(value)
+    except ValueError:
         return default
 
 
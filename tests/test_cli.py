@@ -0,0 +1,77 @@
+"""Tests for CLI report writers."""
+
+import json
+
+import pytest
+
+from compliance_copilot import cli
+from compliance_copilot.engine import RuleResult, RuleStatus
+
+
+# Record layout of results.json as originally written with json.dump
+RECORD_KEYS = [
+    "rule_id", "rule_name", "status", "pass_rate", "total_rows",
+    "passed_rows", "failed_rows", "execution_time_ms", "error",
+]
+
+
+def _results():
+    return [
+        RuleResult(rule_id="R1", rule_name="MFA \"enabled\"", status=RuleStatus.PASS,
+                   total_rows=4, passed_rows=4, execution_time_ms=1.5),
+        RuleResult(rule_id="R2", rule_name="Ünïcode ✓", status=RuleStatus.FAIL,
+                   total_rows=3, passed_rows=1, failed_rows=2),
+        RuleResult(rule_id="R3", rule_name="broken", status=RuleStatus.ERROR,
+                   error_message="No such column: x"),
+    ]
+
+
+def _expected(results):
+    return {
+        "summary": {"total": 3, "passed": 1, "failed": 1, "errors": 1},
+        "results": [
+            {
+                "rule_id": r.rule_id,
+                "rule_name": r.rule_name,
+                "status": r.status.value,
+                "pass_rate": r.pass_rate,
+                "total_rows": r.total_rows,
+                "passed_rows": r.passed_rows,
+                "failed_rows": r.failed_rows,
+                "execution_time_ms": r.execution_time_ms,
+                "error": r.error_message,
+            }
+            for r in results
+        ],
+    }
+
+
+def test_json_results_match_baseline_format(tmp_path):
+    results = _results()
+    path = tmp_path / "results.json"
+
+    cli.save_json_results(results, path)
+
+    text = path.read_text(encoding="utf-8")
+    assert text.startswith('{\n  "timestamp"')
+    data = json.loads(text)
+    assert list(data) == ["timestamp", "summary", "results"]
+    assert [list(record) for record in data["results"]] == [RECORD_KEYS] * 3
+    del data["timestamp"]
+    assert data == _expected(results)
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_streamed_json_results_match_whole_document(tmp_path, monkeypatch, pretty):
+    results = _results()
+    whole, streamed = tmp_path / "whole.json", tmp_path / "streamed.json"
+
+    cli.save_json_results(results, whole, pretty=pretty)
+    monkeypatch.setattr(cli, "JSON_STREAM_THRESHOLD", 0)
+    cli.save_json_results(results, streamed, pretty=pretty)
+
+    whole_data = json.loads(whole.read_text(encoding="utf-8"))
+    streamed_data = json.loads(streamed.read_text(encoding="utf-8"))
+    assert list(streamed_data) == list(whole_data)
+    del whole_data["timestamp"], streamed_data["timestamp"]
+    assert streamed_data == whole_data == _expected(results)
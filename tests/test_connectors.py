@@ -0,0 +1,130 @@
+"""Tests for file connectors."""
+
+import json
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from compliance_copilot.connectors.csv_connector import CSVConnector
+from compliance_copilot.connectors.excel_connector import ExcelConnector
+from compliance_copilot.connectors.exceptions import DataLoadError
+from compliance_copilot.connectors.json_connector import JSONConnector
+from compliance_copilot.connectors.sqlite_connector import SQLiteConnector, _quote_identifier
+
+
+RECORDS = [
+    {"user": "alice", "created_at": "2024-01-05T10:00:00", "logins": 3},
+    {"user": "bob", "created_at": "2024-02-10T08:30:00", "logins": 0},
+]
+
+
+def test_json_array_converts_iso_dates(tmp_path):
+    path = tmp_path / "users.json"
+    path.write_text(json.dumps(RECORDS))
+
+    df = JSONConnector().load(str(path))
+
+    assert pd.api.types.is_datetime64_any_dtype(df["created_at"])
+    assert df["created_at"].iloc[0] == pd.Timestamp("2024-01-05 10:00:00")
+    assert df["logins"].tolist() == [3, 0]
+    assert df["user"].tolist() == ["alice", "bob"]
+
+
+def test_json_lines_matches_read_json(tmp_path):
+    path = tmp_path / "users.json"
+    path.write_text("\n".join(json.dumps(record) for record in RECORDS) + "\n")
+
+    df = JSONConnector({"lines": True}).load(str(path))
+
+    pd.testing.assert_frame_equal(df, pd.read_json(path, lines=True))
+    assert pd.api.types.is_datetime64_any_dtype(df["created_at"])
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """A sheet with a blank leading row, a duplicate and an empty header."""
+    pytest.importorskip("openpyxl")
+    from openpyxl import Workbook
+
+    path = tmp_path / "users.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Users"
+    ws.append([None, None, None, None])
+    ws.append(["user", "score", "score", None])
+    ws.append(["alice", 1, 2, "x"])
+    ws.append(["bob", 3, 4, None])
+    wb.create_sheet("Other").append(["id"])
+    wb.save(path)
+    return path
+
+
+@pytest.mark.parametrize("header_row", [0, 1])
+def test_excel_matches_read_excel(workbook, header_row):
+    df = ExcelConnector({"header_row": header_row}).load(str(workbook))
+
+    expected = pd.read_excel(workbook, sheet_name=0, header=header_row)
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_excel_sheet_index_as_string(workbook):
+    df = ExcelConnector({"sheet_name": "0", "header_row": 1}).load(str(workbook))
+
+    assert list(df.columns) == ["user", "score", "score.1", "Unnamed: 3"]
+
+
+def test_excel_missing_sheet(workbook):
+    with pytest.raises(DataLoadError, match="Sheet 'Nope' not found. Available: Users, Other"):
+        ExcelConnector({"sheet_name": "Nope"}).load(str(workbook))
+
+
+def _write_csv(path, rows=25):
+    path.write_text("user,score\n" + "".join(f"u{i},{i}\n" for i in range(rows)))
+    return path
+
+
+@pytest.mark.parametrize("chunksize", [1, 7, 25, 100])
+def test_csv_chunks_concatenate_to_full_load(tmp_path, chunksize):
+    path = _write_csv(tmp_path / "scores.csv")
+    connector = CSVConnector()
+
+    chunks = list(connector.iter_chunks(str(path), chunksize))
+
+    assert all(len(chunk) <= chunksize for chunk in chunks)
+    combined = pd.concat(chunks, ignore_index=True)
+    pd.testing.assert_frame_equal(combined, connector.load(str(path)))
+    assert connector._metadata["rows"] == 25
+
+
+def test_csv_chunksize_config_streams_from_load(tmp_path):
+    path = _write_csv(tmp_path / "scores.csv")
+
+    loaded = CSVConnector({"chunksize": 10}).load(str(path))
+
+    assert not isinstance(loaded, pd.DataFrame)
+    assert [len(chunk) for chunk in loaded] == [10, 10, 5]
+
+
+def test_quote_identifier_doubles_quotes():
+    assert _quote_identifier('weird "name"') == '"weird ""name"""'
+
+
+def test_sqlite_loads_table_with_quoted_name(tmp_path):
+    database = tmp_path / "app.db"
+    table = 'user "accounts"; DROP TABLE x'
+    with sqlite3.connect(database) as conn:
+        conn.execute(f"CREATE TABLE {_quote_identifier(table)} (id INTEGER, name TEXT)")
+        conn.executemany(f"INSERT INTO {_quote_identifier(table)} VALUES (?, ?)",
+                         [(1, "alice"), (2, "bob")])
+    conn.close()
+
+    connector = SQLiteConnector({"database": str(database), "table": table})
+    try:
+        df = connector.load()
+        chunks = list(connector.load(chunksize=1))
+    finally:
+        connector.close()
+
+    assert df.to_dict("records") == [{"id": 1, "name": "alice"}, {"id": 2, "name": "bob"}]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
@@ -0,0 +1,31 @@
+"""Tests for the exception hierarchy."""
+
+import pickle
+
+from compliance_copilot import RuleExecutionError
+
+
+ROW = {f"col{i}": i for i in range(8)}
+
+
+def test_row_data_keyword_is_sampled():
+    error = RuleExecutionError("R1", "a / b > 1", "division by zero", row_data=ROW)
+
+    assert error.sample_row == {f"col{i}": i for i in range(5)}
+    assert "Sample row: {'col0': 0" in str(error)
+    assert error.details["sample_row"] == error.sample_row
+
+
+def test_row_sample_is_kept_as_given():
+    error = RuleExecutionError("R1", "x > 0", "boom", row_sample={"x": -1})
+
+    assert error.sample_row == {"x": -1}
+
+
+def test_sample_survives_pickling():
+    error = RuleExecutionError.from_row("R1", "a / b > 1", "division by zero", ROW)
+
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert restored.sample_row == error.sample_row
+    assert str(restored) == str(error)
@@ -0,0 +1,45 @@
+"""Tests for column-wise condition evaluation."""
+
+import pandas as pd
+import pytest
+
+from compliance_copilot.engine.expression_evaluator import ExpressionEvaluator, compile_numba
+from compliance_copilot.engine.models import Rule
+from compliance_copilot.engine.rule_engine import _eval_rule
+
+
+@pytest.mark.parametrize("engine", [None, "numexpr", "numba", "python"])
+def test_zero_denominator_fails_row(engine):
+    data = pd.DataFrame({"a": [4, 1, 3], "b": [2, 0, 0]})
+    evaluator = ExpressionEvaluator(engine=engine)
+
+    mask = evaluator.evaluate_vectorized("a / b > 1", data)
+
+    assert mask.tolist() == [True, False, False]
+
+
+@pytest.mark.parametrize("engine", [None, "numexpr", "numba"])
+def test_guarded_division_matches_row_semantics(engine):
+    data = pd.DataFrame({"a": [4, 1, 3], "b": [2, 0, 0]})
+    evaluator = ExpressionEvaluator(engine=engine)
+
+    mask = evaluator.evaluate_vectorized("b == 0 or a / b > 1", data)
+
+    assert mask.tolist() == [True, True, True]
+
+
+@pytest.mark.parametrize("engine", [None, "numexpr", "numba"])
+def test_filtered_division_fails_zero_denominator(engine):
+    data = pd.DataFrame({"a": [4, 1, 3, 5], "b": [2, 0, 0, 1], "c": [1, 1, 1, 0]})
+    rule = Rule(id="r1", name="ratio", condition="a / b > 1",
+                data_source="data.csv", filter="c == 1")
+
+    result = _eval_rule((rule, data, False, engine, 10))
+
+    assert result.total_rows == 3
+    assert result.passed_rows == 1
+    assert result.failed_rows == 2
+
+
+def test_numba_kernel_rejects_division():
+    assert compile_numba("a / b > 1") is None
@@ -0,0 +1,76 @@
+"""Tests for alert rendering."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from compliance_copilot import notifier as notifier_module
+from compliance_copilot.engine import RuleResult, RuleStatus
+from compliance_copilot.notifier import Notifier
+
+
+class _FixedDatetime(datetime):
+    @classmethod
+    def utcnow(cls):
+        return cls(2024, 1, 2, 3, 4, 5)
+
+
+@pytest.fixture
+def notifier(tmp_path, monkeypatch):
+    # The notifier's logger writes under ./logs
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(notifier_module, "datetime", _FixedDatetime)
+    return Notifier()
+
+
+def _failure(i, name):
+    return RuleResult(
+        rule_id=f"R{i}", rule_name=name, status=RuleStatus.FAIL,
+        total_rows=10, passed_rows=7, failed_rows=3,
+        violations=[{"row_index": 0, "row_data": {"user": 'a"b\\c', "note": "line\nbreak", "$x": "${y}", "extra": 1}}],
+    )
+
+
+def _baseline_blocks(failures, scan_id, summary):
+    """Blocks as the notifier originally built them, before json= encoding."""
+    blocks = [
+        {"type": "header", "text": {"type": "plain_text",
+                                    "text": f"🚨 {len(failures)} Compliance Rule(s) Failed", "emoji": True}},
+        {"type": "section", "fields": [
+            {"type": "mrkdwn", "text": f"*Scan ID:*\n{scan_id}"},
+            {"type": "mrkdwn", "text": "*Time:*\n2024-01-02 03:04:05 UTC"},
+        ]},
+        {"type": "section", "fields": [
+            {"type": "mrkdwn", "text": f"*Total Rules:* {summary['total']}"},
+            {"type": "mrkdwn", "text": f"*✅ Passed:* {summary['passed']}"},
+            {"type": "mrkdwn", "text": f"*❌ Failed:* {summary['failed']}"},
+            {"type": "mrkdwn", "text": f"*⚠️ Errors:* {summary['errors']}"},
+        ]},
+        {"type": "divider"},
+    ]
+    for failure in failures[:5]:
+        blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": (
+            f"*{failure.rule_id}: {failure.rule_name}*\nFailed: {failure.failed_rows} of "
+            f"{failure.total_rows} rows (Pass rate: {failure.pass_rate:.1f}%)")}})
+        row = failure.violations[0]["row_data"]
+        example = ", ".join(f"{k}={row[k]}" for k in list(row)[:3])
+        blocks.append({"type": "context", "elements": [
+            {"type": "mrkdwn", "text": f"Example violation: {example}..."}]})
+        blocks.append({"type": "divider"})
+    if len(failures) > 5:
+        blocks.append({"type": "section", "text": {"type": "mrkdwn",
+                                                   "text": f"... and {len(failures) - 5} more failures"}})
+    return blocks
+
+
+@pytest.mark.parametrize("count", [1, 7])
+def test_slack_payload_matches_baseline_blocks(notifier, count):
+    failures = [_failure(i, f'Rule "{i}" \\ $name ✓') for i in range(count)]
+    scan_id = 'scan "$id"\n1'
+    summary = {"total": 9, "passed": 2, "failed": count, "errors": 0}
+
+    payload = notifier._build_slack_payload(notifier._normalize_failures(failures), scan_id, summary)
+
+    assert isinstance(payload, bytes)
+    assert json.loads(payload) == {"blocks": _baseline_blocks(failures, scan_id, summary)}
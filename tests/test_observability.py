@@ -0,0 +1,197 @@
+"""Tests for logging, error tracking and metrics."""
+
+import gc
+import json
+import random
+import weakref
+from datetime import datetime, timedelta
+
+import pytest
+
+from compliance_copilot.observability import errors as errors_module
+from compliance_copilot.observability.errors import ErrorCategory, ErrorTracker
+from compliance_copilot.observability.logger import StructuredLogger
+from compliance_copilot.observability.metrics import MetricsCollector, _QuantileSketch
+
+
+def _read_jsonl(directory):
+    return [
+        json.loads(line)
+        for path in sorted(directory.iterdir())
+        for line in path.read_text().splitlines()
+    ]
+
+
+def test_discarded_tracker_is_collected_and_flushed(tmp_path):
+    tracker = ErrorTracker(error_dir=str(tmp_path))
+    tracker.track(ValueError("boom"), "rule")
+    ref = weakref.ref(tracker)
+
+    del tracker
+    gc.collect()
+
+    assert ref() is None
+    assert [entry["error_message"] for entry in _read_jsonl(tmp_path)] == ["boom"]
+
+
+def test_discarded_logger_is_collected_and_flushed(tmp_path):
+    logger = StructuredLogger("collect", log_dir=str(tmp_path), console=False)
+    logger.error("failed", code=1)
+    ref = weakref.ref(logger)
+
+    del logger
+    gc.collect()
+
+    assert ref() is None
+    assert [entry["event"] for entry in _read_jsonl(tmp_path)] == ["failed"]
+
+
+def _orders(n):
+    values = list(range(n))
+    shuffled = values[:]
+    random.Random(7).shuffle(shuffled)
+    return {"sorted": values, "reverse": values[::-1], "random": shuffled}
+
+
+@pytest.mark.parametrize("order", ["sorted", "reverse", "random"])
+@pytest.mark.parametrize("n", [21, 1000, 20000])
+def test_sketch_p95_within_rank_error(order, n):
+    sketch = _QuantileSketch(epsilon=0.01)
+    for value in _orders(n)[order]:
+        sketch.insert(value)
+
+    exact_rank = int(n * 0.95)
+    # Values are 0..n-1, so each one is its own 0-based rank
+    assert abs(sketch.quantile(0.95) - exact_rank) <= sketch.epsilon * n
+
+
+def test_sketch_empty():
+    assert _QuantileSketch().quantile(0.95) is None
+
+
+def test_sketch_keeps_fewer_samples_than_inputs():
+    sketch = _QuantileSketch(epsilon=0.01)
+    for value in _orders(20000)["random"]:
+        sketch.insert(value)
+
+    assert len(sketch._values) < 2000
+
+
+def test_p95_needs_more_than_20_timings(tmp_path):
+    metrics = MetricsCollector(metrics_dir=str(tmp_path))
+    for ms in range(20):
+        metrics.record_timer("scan", ms)
+    assert metrics._summarize_timers()["scan"]["p95_ms"] is None
+
+    metrics.record_timer("scan", 20)
+    timers = metrics._summarize_timers()["scan"]
+    assert timers["count"] == 21
+    assert timers["p95_ms"] == sorted(range(21))[int(21 * 0.95)]
+
+
+# Keys of an error record as originally written with json.dumps
+ERROR_KEYS = [
+    "timestamp", "category", "severity", "error_type", "error_message",
+    "user_message", "stack_trace", "context",
+]
+
+
+class _Tomorrow(datetime):
+    @classmethod
+    def utcnow(cls):
+        return datetime.utcnow() + timedelta(days=1)
+
+
+def test_error_jsonl_matches_baseline_format(tmp_path):
+    tracker = ErrorTracker(error_dir=str(tmp_path))
+    tracker.track(ValueError('bad "quote" ✓'), ErrorCategory.DATA_LOAD, context={"path": "x.csv"})
+    tracker.flush()
+
+    (entry,) = _read_jsonl(tmp_path)
+    assert list(entry) == ERROR_KEYS
+    assert entry["error_type"] == "ValueError"
+    assert entry["error_message"] == 'bad "quote" ✓'
+    assert entry["user_message"] == 'Could not load data: bad "quote" ✓'
+    assert entry["context"] == {"path": "x.csv"}
+    datetime.fromisoformat(entry["timestamp"])
+    tracker.close()
+
+
+def test_error_lines_are_batched_until_flush(tmp_path, monkeypatch):
+    monkeypatch.setattr(errors_module, "FLUSH_LINES", 3)
+    tracker = ErrorTracker(error_dir=str(tmp_path))
+
+    for i in range(2):
+        tracker.track(ValueError(str(i)), "rule", severity="WARNING")
+    assert _read_jsonl(tmp_path) == []
+
+    tracker.track(ValueError("2"), "rule", severity="WARNING")
+    assert [e["error_message"] for e in _read_jsonl(tmp_path)] == ["0", "1", "2"]
+
+    tracker.track(ValueError("3"), "rule", severity="WARNING")
+    tracker.close()
+    assert [e["error_message"] for e in _read_jsonl(tmp_path)] == ["0", "1", "2", "3"]
+
+
+def test_error_file_rolls_over_at_midnight(tmp_path, monkeypatch):
+    tracker = ErrorTracker(error_dir=str(tmp_path))
+    tracker.track(ValueError("today"), "rule")
+
+    monkeypatch.setattr(errors_module, "datetime", _Tomorrow)
+    tracker._rollover_at = 0.0
+    tracker.track(ValueError("tomorrow"), "rule")
+    tracker.close()
+
+    files = sorted(tmp_path.iterdir())
+    tomorrow = _Tomorrow.utcnow().strftime("%Y%m%d")
+    assert [f.name for f in files][-1] == f"errors_{tomorrow}.jsonl"
+    assert [[json.loads(line)["error_message"] for line in f.read_text().splitlines()] for f in files] == [
+        ["today"], ["tomorrow"]
+    ]
+
+
+def _file_logger(tmp_path, name):
+    return StructuredLogger(name, log_dir=str(tmp_path), console=False)
+
+
+def test_log_lines_are_buffered_until_flush(tmp_path):
+    logger = _file_logger(tmp_path, "buffered")
+
+    logger._write_json_file({"timestamp": "t", "logger": "buffered", "level": "INFO", "event": "one", "n": 1})
+    assert _read_jsonl(tmp_path) == []
+
+    logger.flush()
+    assert _read_jsonl(tmp_path) == [{"timestamp": "t", "logger": "buffered", "level": "INFO", "event": "one", "n": 1}]
+
+    # Errors are written through straight away
+    logger._write_json_file({"timestamp": "t", "logger": "buffered", "level": "ERROR", "event": "two"})
+    assert [e["event"] for e in _read_jsonl(tmp_path)] == ["one", "two"]
+
+
+def test_log_entry_matches_baseline_format(tmp_path):
+    logger = _file_logger(tmp_path, "format")
+
+    logger.error("scan_failed", rules=3, path="a b")
+
+    (entry,) = _read_jsonl(tmp_path)
+    assert list(entry) == ["timestamp", "logger", "level", "event", "rules", "path"]
+    assert entry["timestamp"].endswith("Z")
+    datetime.fromisoformat(entry["timestamp"][:-1])
+    assert entry["logger"] == "format" and entry["level"] == "ERROR"
+    assert (entry["event"], entry["rules"], entry["path"]) == ("scan_failed", 3, "a b")
+
+
+def test_log_flush_rotates_files(tmp_path):
+    logger = _file_logger(tmp_path, "rotating")
+    logger.file_handler.maxBytes = 300
+
+    for i in range(20):
+        logger._write_json_file({"timestamp": "t", "logger": "rotating", "level": "INFO", "event": "e", "i": i})
+        logger.flush()
+
+    files = list(tmp_path.iterdir())
+    assert len(files) > 1
+    assert all(f.stat().st_size <= 300 for f in files)
+    kept = sorted(entry["i"] for entry in _read_jsonl(tmp_path))
+    # Rotation keeps backupCount old files; what remains is the newest lines, intact
+    assert kept == list(range(20 - len(kept), 20))
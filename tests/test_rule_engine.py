@@ -0,0 +1,121 @@
+"""Tests for rule evaluation in the engine."""
+
+import os
+
+import pandas as pd
+
+from compliance_copilot.engine import DataCache, Rule, RuleEngine
+
+
+def _rules(count):
+    return [
+        Rule(id=f"R{i}", name=f"rule {i}", condition=f"x >= {i}", data_source="data.csv")
+        for i in range(count)
+    ]
+
+
+def _summary(results):
+    return [
+        (r.rule_id, r.status, r.total_rows, r.passed_rows, r.failed_rows,
+         [v["row_index"] for v in r.violations])
+        for r in results
+    ]
+
+
+def test_engine_is_serial_by_default():
+    assert RuleEngine().workers == 1
+
+
+def test_parallel_matches_serial():
+    data = pd.DataFrame({"x": range(20)})
+    rules = _rules(6)
+
+    serial = RuleEngine(workers=1)._evaluate_frame(rules, data)
+    parallel = RuleEngine(workers=2)._evaluate_frame(rules, data)
+
+    assert _summary(parallel) == _summary(serial)
+
+
+def test_debug_stays_serial(monkeypatch, capsys):
+    engine = RuleEngine(debug=True, workers=4)
+
+    def fail(*args):
+        raise AssertionError("debug runs must not use worker processes")
+
+    monkeypatch.setattr(engine, "_evaluate_parallel", fail)
+    results = engine._evaluate_frame(_rules(4), pd.DataFrame({"x": range(3)}))
+
+    assert [r.passed_rows for r in results] == [3, 2, 1, 0]
+
+
+def test_chunked_evaluation_matches_whole_frame(tmp_path):
+    data_dir, rules_dir = tmp_path / "data", tmp_path / "rules"
+    data_dir.mkdir()
+    rules_dir.mkdir()
+    (data_dir / "scores.csv").write_text("x,group\n" + "".join(f"{i % 7},{i % 3}\n" for i in range(50)))
+    (rules_dir / "rules.yaml").write_text(
+        "rules:\n"
+        "  - id: R1\n    name: small\n    condition: x < 5\n    data_source: scores.csv\n"
+        "  - id: R2\n    name: filtered\n    condition: x != 3\n    filter: group == 1\n"
+        "    data_source: scores.csv\n"
+    )
+
+    whole = RuleEngine({"engine": {"max_violations_per_rule": 4}}).run(str(rules_dir), str(data_dir))
+    chunked = RuleEngine({
+        "engine": {"max_violations_per_rule": 4},
+        "connectors": {"csv": {"chunksize": 6}},
+    }).run(str(rules_dir), str(data_dir))
+
+    assert _summary(chunked) == _summary(whole)
+    assert [r.truncated for r in chunked] == [r.truncated for r in whole]
+    assert [r.violations for r in chunked] == [r.violations for r in whole]
+
+
+def test_data_cache_reuses_unchanged_file(tmp_path):
+    path = tmp_path / "scores.csv"
+    path.write_text("x\n1\n")
+    cache = DataCache(max_mb=1)
+    frame = pd.DataFrame({"x": [1]})
+
+    key = cache.key(str(path))
+    cache.put(key, frame)
+
+    assert cache.get(cache.key(str(path))) is frame
+
+
+def test_data_cache_misses_after_rewrite(tmp_path):
+    path = tmp_path / "scores.csv"
+    path.write_text("x\n1\n")
+    cache = DataCache(max_mb=1)
+    cache.put(cache.key(str(path)), pd.DataFrame({"x": [1]}))
+
+    # Same size, new mtime
+    stat = path.stat()
+    path.write_text("x\n2\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get(cache.key(str(path))) is None
+
+    # New size, mtime forced back to the cached one
+    cache.put(cache.key(str(path)), pd.DataFrame({"x": [2]}))
+    stat = path.stat()
+    path.write_text("x\n22\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert cache.get(cache.key(str(path))) is None
+
+
+def test_data_cache_off_and_eviction(tmp_path):
+    paths = []
+    for name in ("a.csv", "b.csv"):
+        path = tmp_path / name
+        path.write_text("x\n1\n")
+        paths.append(str(path))
+    assert DataCache(max_mb=0).key(paths[0]) is None
+
+    frame = pd.DataFrame({"x": range(1000)})
+    nbytes = int(frame.memory_usage(deep=True).sum())
+    cache = DataCache(max_mb=1.5 * nbytes / (1024 * 1024))
+    cache.put(cache.key(paths[0]), frame)
+    cache.put(cache.key(paths[1]), frame.copy())
+
+    assert cache.get(cache.key(paths[0])) is None
+    assert cache.get(cache.key(paths[1])) is not None
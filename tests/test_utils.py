@@ -0,0 +1,66 @@
+"""Tests for shared utilities."""
+
+import os
+import time
+
+import pytest
+
+from compliance_copilot import utils
+from compliance_copilot.utils import list_files
+
+
+@pytest.fixture(autouse=True)
+def _empty_dir_cache():
+    utils._dir_cache.clear()
+    yield
+    utils._dir_cache.clear()
+
+
+def _settle(directory, mtime_ns):
+    os.utime(directory, ns=(mtime_ns, mtime_ns))
+
+
+def test_list_files_filters_by_extension(tmp_path):
+    for name in ("a.yaml", "b.yaml", "c.txt"):
+        (tmp_path / name).write_text("")
+    (tmp_path / "sub.yaml").mkdir()
+
+    assert sorted(p.name for p in list_files(str(tmp_path), ".yaml")) == ["a.yaml", "b.yaml"]
+    assert sorted(p.name for p in list_files(str(tmp_path))) == ["a.yaml", "b.yaml", "c.txt"]
+
+
+def test_list_files_missing_directory(tmp_path):
+    assert list_files(str(tmp_path / "missing")) == []
+
+
+def test_list_files_reuses_scan_until_mtime_changes(tmp_path):
+    (tmp_path / "a.yaml").write_text("")
+    old = time.time_ns() - 10_000_000_000
+    _settle(tmp_path, old)
+    assert [p.name for p in list_files(str(tmp_path), ".yaml")] == ["a.yaml"]
+
+    # An unchanged directory mtime is trusted: the cached scan is returned
+    (tmp_path / "b.yaml").write_text("")
+    _settle(tmp_path, old)
+    assert [p.name for p in list_files(str(tmp_path), ".yaml")] == ["a.yaml"]
+
+    # A new mtime forces a rescan
+    _settle(tmp_path, old + 1_000_000_000)
+    assert sorted(p.name for p in list_files(str(tmp_path), ".yaml")) == ["a.yaml", "b.yaml"]
+
+
+def test_list_files_skips_cache_for_recent_changes(tmp_path):
+    (tmp_path / "a.yaml").write_text("")
+    list_files(str(tmp_path), ".yaml")
+
+    # The directory changed just now, so its scan was not remembered
+    assert utils._dir_cache == {}
+
+
+def test_list_files_returns_a_copy(tmp_path):
+    (tmp_path / "a.yaml").write_text("")
+    _settle(tmp_path, time.time_ns() - 10_000_000_000)
+
+    list_files(str(tmp_path)).clear()
+
+    assert [p.name for p in list_files(str(tmp_path))] == ["a.yaml"]